@@ -12,6 +12,7 @@ Heavy dependencies (torch/transformers/peft) are imported lazily to keep test en
 
 from __future__ import annotations
 
+import heapq
 import json
 import math
 import uuid
@@ -19,8 +20,9 @@ import logging
 import time
 from collections import Counter
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional
 
 import yaml
 
@@ -35,6 +37,18 @@ try:
 except Exception:  # pragma: no cover - optional dependency for remote LLM
     requests = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ---------- Retrieval utilities (lightweight, CPU-friendly) ----------
 def _tokenize(text: str) -> List[str]:
@@ -47,13 +61,18 @@ def _bow_embed(text: str) -> Counter:
     return Counter(_tokenize(text))
 
 
-def _cosine(a: Counter, b: Counter) -> float:
-    """Cosine similarity between two sparse vectors."""
+def _norm(vec: Counter) -> float:
+    return math.sqrt(sum(v * v for v in vec.values()))
+
+
+def _cosine(a: Counter, b: Counter, norm_a: Optional[float] = None) -> float:
+    """Cosine similarity between two sparse vectors; pass ``norm_a`` to reuse a precomputed norm."""
     if not a or not b:
         return 0.0
     dot = sum(a[k] * b.get(k, 0) for k in a)
-    norm_a = math.sqrt(sum(v * v for v in a.values()))
-    norm_b = math.sqrt(sum(v * v for v in b.values()))
+    if norm_a is None:
+        norm_a = _norm(a)
+    norm_b = _norm(b)
     if norm_a == 0 or norm_b == 0:
         return 0.0
     return dot / (norm_a * norm_b)
@@ -74,13 +93,13 @@ def load_chunk_index(path: str | Path) -> List[Dict[str, Any]]:
     if not p.exists():
         return []
     chunks: List[Dict[str, Any]] = []
-    with p.open("r", encoding="utf-8") as handle:
+    with p.open("rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = _json_loads(line)
                 if isinstance(obj, dict) and "text" in obj:
                     chunks.append(obj)
             except json.JSONDecodeError:
@@ -141,15 +160,11 @@ def retrieve_relevant_chunks(doc: Dict[str, Any], chunk_index: List[Dict[str, An
     ]
     query_text = " ".join(parts)
     query_vec = _bow_embed(query_text)
+    query_norm = _norm(query_vec)
 
-    scored: List[Tuple[float, Dict[str, Any]]] = []
-    for ch in chunk_index:
-        text = str(ch.get("text", ""))
-        score = _cosine(query_vec, _bow_embed(text))
-        scored.append((score, ch))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top_items = scored[: top_k if top_k > 0 else 5]
+    scored = ((_cosine(query_vec, _bow_embed(str(ch.get("text", ""))), query_norm), ch) for ch in chunk_index)
+    # nlargest keeps the stable order of sorted(..., reverse=True)[:n] without sorting every chunk.
+    top_items = heapq.nlargest(top_k if top_k > 0 else 5, scored, key=itemgetter(0))
 
     results: List[Dict[str, Any]] = []
     for score, ch in top_items:
@@ -313,7 +328,7 @@ def load_rules_for_doc(doc_type: str) -> List[Dict[str, Any]]:
     if not rules_path.exists():
         return []
     with rules_path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or []
+        return yaml.load(handle, Loader=_YamlLoader) or []
 
 
 # ---------- End-to-end audit ----------
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from decimal import Decimal
+from typing import Dict, List, Tuple
 
 from backend.accounting_models import (
     BankEntry,
@@ -27,6 +28,9 @@ _store: Dict[str, Dict[str, List]] = {
 }
 
 _BANK_ENTRIES: Dict[str, List[BankEntry]] = {}
+# engagement_id -> (sorted amounts, (stored position, entry) in amount order). Built on first
+# use and dropped whenever the engagement's bank entries are saved or cleared.
+_BANK_AMOUNT_INDEX: Dict[str, Tuple[List[Decimal], List[Tuple[int, BankEntry]]]] = {}
 _PAYROLL_EMPLOYEES: Dict[str, List[PayrollEmployee]] = {}
 _PAYROLL_ENTRIES: Dict[str, List[PayrollEntry]] = {}
 _INVENTORY_ITEMS: Dict[str, List[InventoryItem]] = {}
@@ -67,12 +71,35 @@ def get_gl_entries(engagement_id: str) -> List[GLEntry]:
 
 def save_bank_entries(engagement_id: str, entries: List[BankEntry]) -> None:
     _BANK_ENTRIES[engagement_id] = entries
+    _BANK_AMOUNT_INDEX.pop(engagement_id, None)
 
 
 def get_bank_entries(engagement_id: str) -> List[BankEntry]:
     return _BANK_ENTRIES.get(engagement_id, [])
 
 
+def get_bank_amount_index(engagement_id: str) -> Tuple[List[Decimal], List[Tuple[int, BankEntry]]]:
+    """
+    Bank entries sorted by amount, as (amounts, [(position, entry), ...]).
+
+    Cached until the next save_bank_entries/clear_engagement for the engagement, so
+    entries must be replaced through save_bank_entries rather than edited in place.
+    """
+    index = _BANK_AMOUNT_INDEX.get(engagement_id)
+    if index is not None:
+        return index
+    entries = _BANK_ENTRIES.get(engagement_id)
+    if not entries:
+        return [], []
+    ordered = sorted(
+        ((Decimal(str(entry.amount)), pos, entry) for pos, entry in enumerate(entries)),
+        key=lambda t: (t[0], t[1]),
+    )
+    index = ([amount for amount, _, _ in ordered], [(pos, entry) for _, pos, entry in ordered])
+    _BANK_AMOUNT_INDEX[engagement_id] = index
+    return index
+
+
 def save_payroll_employees(engagement_id: str, employees: List[PayrollEmployee]) -> None:
     _PAYROLL_EMPLOYEES[engagement_id] = employees
 
@@ -166,6 +193,7 @@ def clear_engagement(engagement_id: str) -> None:
     _store["trial_balances"].pop(engagement_id, None)
     _store["transactions"].pop(engagement_id, None)
     _BANK_ENTRIES.pop(engagement_id, None)
+    _BANK_AMOUNT_INDEX.pop(engagement_id, None)
     _PAYROLL_EMPLOYEES.pop(engagement_id, None)
     _PAYROLL_ENTRIES.pop(engagement_id, None)
     _INVENTORY_ITEMS.pop(engagement_id, None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from io import TextIOWrapper
 from typing import BinaryIO, List
@@ -11,6 +11,17 @@ from backend.accounting_models import DepreciationEntry, FixedAsset
 DATE_FMT = "%Y-%m-%d"
 
 
+def _parse_date(raw: str) -> date:
+    # fromisoformat also accepts forms like 20240115 and 2024-W03-1, so only take the
+    # fast path for the YYYY-MM-DD shape; everything else gets the strict strptime check.
+    if len(raw) == 10 and raw[4] == raw[7] == "-":
+        try:
+            return date.fromisoformat(raw)
+        except ValueError:
+            pass
+    return datetime.strptime(raw, DATE_FMT).date()
+
+
 def parse_assets_csv(file_obj: BinaryIO) -> List[FixedAsset]:
     wrapper = TextIOWrapper(file_obj, encoding="utf-8")
     reader = csv.DictReader(wrapper)
@@ -19,14 +30,14 @@ def parse_assets_csv(file_obj: BinaryIO) -> List[FixedAsset]:
         if not row:
             continue
         disposal_raw = (row.get("disposal_date") or "").strip()
-        disposal_date = datetime.strptime(disposal_raw, DATE_FMT).date() if disposal_raw else None
+        disposal_date = _parse_date(disposal_raw) if disposal_raw else None
         assets.append(
             FixedAsset(
                 id=row.get("id") or f"asset-{idx}",
                 asset_code=row["asset_code"].strip(),
                 description=row.get("description", "").strip(),
                 category=row.get("category", "").strip(),
-                acquisition_date=datetime.strptime(row["acquisition_date"].strip(), DATE_FMT).date(),
+                acquisition_date=_parse_date(row["acquisition_date"].strip()),
                 acquisition_cost=Decimal(row["acquisition_cost"]),
                 useful_life_years=Decimal(row["useful_life_years"]),
                 disposal_date=disposal_date,
@@ -46,7 +57,7 @@ def parse_depreciation_csv(file_obj: BinaryIO) -> List[DepreciationEntry]:
             DepreciationEntry(
                 id=row.get("id") or f"dep-{idx}",
                 asset_code=row["asset_code"].strip(),
-                period_end=datetime.strptime(row["period_end"].strip(), DATE_FMT).date(),
+                period_end=_parse_date(row["period_end"].strip()),
                 depreciation_expense=Decimal(row["depreciation_expense"]),
                 accumulated_depreciation=Decimal(row["accumulated_depreciation"]),
                 net_book_value=Decimal(row["net_book_value"]),
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import csv
-import io
 from datetime import date, datetime, time
 from decimal import Decimal, InvalidOperation
-from typing import BinaryIO, List
+from typing import Any, Iterable, List, Mapping
 
 from backend.accounting_models import BankEntry
+from backend.ingestion_io import CsvInput, text_stream
 
 
 def _parse_date(raw: str) -> date:
@@ -41,15 +41,13 @@ def _to_decimal(raw: str | None) -> Decimal:
         raise ValueError(f"Invalid decimal value: {raw}") from exc
 
 
-def parse_bank_csv(file_obj: BinaryIO) -> List[BankEntry]:
-    content = file_obj.read()
-    if isinstance(content, bytes):
-        text = content.decode("utf-8")
-    else:
-        text = str(content)
-    reader = csv.DictReader(io.StringIO(text))
+def parse_bank_csv(file_obj: CsvInput) -> List[BankEntry]:
+    return parse_bank_rows(csv.DictReader(text_stream(file_obj)))
+
+
+def parse_bank_rows(rows: Iterable[Mapping[str, Any]]) -> List[BankEntry]:
     entries: List[BankEntry] = []
-    for idx, row in enumerate(reader, start=1):
+    for idx, row in enumerate(rows, start=1):
         if not row:
             continue
         try:
@@ -23,7 +23,7 @@ class BookFinding(BaseModel):
 RESTRICTED_ACCOUNT_CODES = {"9999", "9998"}
 
 
-def run_books_rules(engagement_id: str) -> List[BookFinding]:
+def run_books_rules(engagement_id: str, today: Optional[date] = None) -> List[BookFinding]:
     tb_rows = get_trial_balance(engagement_id)
     transactions = get_transactions(engagement_id)
     findings: List[BookFinding] = []
@@ -65,7 +65,7 @@ def run_books_rules(engagement_id: str) -> List[BookFinding]:
 
     if transactions:
         oldest = min(txn.date for txn in transactions)
-        if oldest and oldest < date.today().replace(month=1, day=1):
+        if oldest and oldest < (today or date.today()).replace(month=1, day=1):
             findings.append(
                 BookFinding(
                     id=f"{engagement_id}-prior-period",
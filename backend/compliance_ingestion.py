@@ -3,17 +3,16 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from decimal import Decimal
-from io import TextIOWrapper
-from typing import BinaryIO, List
+from typing import List
 
 from backend.accounting_models import BooksTaxRow, TaxReturnRow
+from backend.ingestion_io import CsvInput, text_stream
 
 DATE_FMT = "%Y-%m-%d"
 
 
-def parse_returns_csv(file_obj: BinaryIO) -> List[TaxReturnRow]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_returns_csv(file_obj: CsvInput) -> List[TaxReturnRow]:
+    reader = csv.DictReader(text_stream(file_obj))
     rows: List[TaxReturnRow] = []
     for row in reader:
         if not row:
@@ -31,9 +30,8 @@ def parse_returns_csv(file_obj: BinaryIO) -> List[TaxReturnRow]:
     return rows
 
 
-def parse_books_tax_csv(file_obj: BinaryIO) -> List[BooksTaxRow]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_books_tax_csv(file_obj: CsvInput) -> List[BooksTaxRow]:
+    reader = csv.DictReader(text_stream(file_obj))
     rows: List[BooksTaxRow] = []
     for row in reader:
         if not row:
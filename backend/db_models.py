@@ -86,7 +86,7 @@ class FindingORM(Base):
     severity = Column(String, nullable=False)
     code = Column(String, nullable=False)
     message = Column(Text, nullable=False)
-    metadata_json = Column(JSONType, nullable=True)
+    metadata_json = Column(JSONType, nullable=True, default=dict)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
 
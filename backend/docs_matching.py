@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import timedelta
 from decimal import Decimal
 from typing import Optional, Tuple
 
-from .accounting_store import get_bank_entries
+from .accounting_store import get_bank_amount_index
 from .db_models import DocumentORM
 from .domain_rules import DomainLiteral
 
@@ -27,33 +28,31 @@ def match_document_to_bank_entries(
     Returns (domain, entry_id) or None if no reasonable match.
     For now, domain is always "bank" because we only match against bank entries.
     """
-    entries = get_bank_entries(engagement_id)
-
-    if not entries:
+    if doc.amount is None:
+        return None
+    amounts, positioned = get_bank_amount_index(engagement_id)
+    if not amounts:
         return None
 
-    candidates = []
-    doc_amount = Decimal(str(doc.amount)) if doc.amount is not None else None
-    for entry in entries:
-        if doc_amount is None:
-            continue
-        diff = Decimal(str(entry.amount)) - doc_amount
-        if diff.copy_abs() > AMOUNT_TOLERANCE:
-            continue
+    doc_amount = Decimal(str(doc.amount))
+    lo = bisect_left(amounts, doc_amount - AMOUNT_TOLERANCE)
+    hi = bisect_right(amounts, doc_amount + AMOUNT_TOLERANCE)
 
+    best = None
+    for i in range(lo, hi):
+        pos, entry = positioned[i]
         if doc.date and entry.date:
             delta = abs(entry.date - doc.date)
             if delta > timedelta(days=DATE_TOLERANCE_DAYS):
                 continue
 
-        score = diff.copy_abs()
-        candidates.append((score, entry))
+        # Closest amount wins; ties go to the entry stored first.
+        key = ((amounts[i] - doc_amount).copy_abs(), pos)
+        if best is None or key < best[0]:
+            best = (key, entry)
 
-    if not candidates:
+    if best is None:
         return None
 
-    candidates.sort(key=lambda t: t[0])
-    _, best = candidates[0]
-
-    entry_id = build_bank_entry_id(best)
+    entry_id = build_bank_entry_id(best[1])
     return "bank", entry_id
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from io import BufferedIOBase, RawIOBase, StringIO, TextIOBase, TextIOWrapper
+from typing import BinaryIO, TextIO, Union
+
+CsvInput = Union[BinaryIO, TextIO, str]
+
+
+def text_stream(file_obj: CsvInput) -> TextIO:
+    """
+    Text view over uploaded CSV content for the ingestion parsers.
+
+    Accepts the CSV as a string, a text stream, or a UTF-8 binary stream. Other
+    file-likes are read in full, decoding bytes as UTF-8.
+    """
+    if isinstance(file_obj, str):
+        return StringIO(file_obj)
+    if isinstance(file_obj, TextIOBase):
+        return file_obj
+    if isinstance(file_obj, (BufferedIOBase, RawIOBase)):
+        return TextIOWrapper(file_obj, encoding="utf-8")
+    content = file_obj.read()
+    return StringIO(content.decode("utf-8") if isinstance(content, bytes) else str(content))
@@ -3,15 +3,14 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from decimal import Decimal
-from io import TextIOWrapper
-from typing import BinaryIO, List
+from typing import List
 
 from backend.accounting_models import InventoryItem, InventoryMovement
+from backend.ingestion_io import CsvInput, text_stream
 
 
-def parse_inventory_items_csv(file_obj: BinaryIO) -> List[InventoryItem]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_inventory_items_csv(file_obj: CsvInput) -> List[InventoryItem]:
+    reader = csv.DictReader(text_stream(file_obj))
     items: List[InventoryItem] = []
     for row in reader:
         if not row:
@@ -31,9 +30,8 @@ def parse_inventory_items_csv(file_obj: BinaryIO) -> List[InventoryItem]:
     return items
 
 
-def parse_inventory_movements_csv(file_obj: BinaryIO) -> List[InventoryMovement]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_inventory_movements_csv(file_obj: CsvInput) -> List[InventoryMovement]:
+    reader = csv.DictReader(text_stream(file_obj))
     moves: List[InventoryMovement] = []
     for idx, row in enumerate(reader):
         if not row:
@@ -3,15 +3,14 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from decimal import Decimal
-from io import TextIOWrapper
-from typing import BinaryIO, List
+from typing import List
 
 from backend.accounting_models import APEntry, LoanAccount, LoanPeriodEntry
+from backend.ingestion_io import CsvInput, text_stream
 
 
-def parse_loans_csv(file_obj: BinaryIO) -> List[LoanAccount]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_loans_csv(file_obj: CsvInput) -> List[LoanAccount]:
+    reader = csv.DictReader(text_stream(file_obj))
     loans: List[LoanAccount] = []
     for row in reader:
         if not row:
@@ -31,9 +30,8 @@ def parse_loans_csv(file_obj: BinaryIO) -> List[LoanAccount]:
     return loans
 
 
-def parse_loan_periods_csv(file_obj: BinaryIO) -> List[LoanPeriodEntry]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_loan_periods_csv(file_obj: CsvInput) -> List[LoanPeriodEntry]:
+    reader = csv.DictReader(text_stream(file_obj))
     periods: List[LoanPeriodEntry] = []
     for idx, row in enumerate(reader):
         if not row:
@@ -52,9 +50,8 @@ def parse_loan_periods_csv(file_obj: BinaryIO) -> List[LoanPeriodEntry]:
     return periods
 
 
-def parse_ap_entries_csv(file_obj: BinaryIO) -> List[APEntry]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_ap_entries_csv(file_obj: CsvInput) -> List[APEntry]:
+    reader = csv.DictReader(text_stream(file_obj))
     entries: List[APEntry] = []
     for idx, row in enumerate(reader):
         if not row:
@@ -3,15 +3,14 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from decimal import Decimal
-from io import TextIOWrapper
-from typing import BinaryIO, List
+from typing import List
 
 from backend.accounting_models import PayrollEmployee, PayrollEntry
+from backend.ingestion_io import CsvInput, text_stream
 
 
-def parse_payroll_employee_csv(file_obj: BinaryIO) -> List[PayrollEmployee]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_payroll_employee_csv(file_obj: CsvInput) -> List[PayrollEmployee]:
+    reader = csv.DictReader(text_stream(file_obj))
     employees: List[PayrollEmployee] = []
     for idx, row in enumerate(reader):
         if not row:
@@ -28,9 +27,8 @@ def parse_payroll_employee_csv(file_obj: BinaryIO) -> List[PayrollEmployee]:
     return employees
 
 
-def parse_payroll_entries_csv(file_obj: BinaryIO) -> List[PayrollEntry]:
-    wrapper = TextIOWrapper(file_obj, encoding="utf-8")
-    reader = csv.DictReader(wrapper)
+def parse_payroll_entries_csv(file_obj: CsvInput) -> List[PayrollEntry]:
+    reader = csv.DictReader(text_stream(file_obj))
     entries: List[PayrollEntry] = []
     for idx, row in enumerate(reader):
         if not row:
@@ -12,6 +12,11 @@ import yaml
 from rule_engine.core import apply_rules
 from rule_engine.context import get_context_for_year
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 
 def base_w2_document(tax_year: int = 2024) -> Dict[str, Any]:
     """Return a clean W-2 document that should not trigger rules."""
@@ -133,7 +138,7 @@ def perturb_int_bad_recipient_tin(doc: Dict[str, Any]) -> Dict[str, Any]:
 
 def _load_rules(path: Path) -> List[Dict[str, Any]]:
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or []
+        return yaml.load(handle, Loader=_YamlLoader) or []
 
 
 def generate_w2_scenarios(tax_year: int = 2024) -> List[Dict[str, Any]]:
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import re
 import uuid
-from typing import Any, Dict, List, Mapping, Optional
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
 
 try:  # pragma: no cover - support running as script/module
+    from .loader import parse_condition
     from .registry import RuleRegistry, build_default_registry
 except ImportError:  # pragma: no cover - fallback for direct execution
+    from loader import parse_condition
     from registry import RuleRegistry, build_default_registry
 try:  # pragma: no cover - support running as script/module
     from .rules_metadata import get_rule_metadata
@@ -16,6 +20,11 @@ except ImportError:  # pragma: no cover - fallback for direct execution
     from rules_metadata import get_rule_metadata
 
 
+_SSN_RE = re.compile(r"\d{3}-\d{2}-\d{4}")
+_EIN_RE = re.compile(r"\d{2}-?\d{7}")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
 class RuleEngineError(Exception):
     """Raised when rule evaluation cannot proceed."""
 
@@ -42,15 +51,30 @@ def _pct_diff(a: float, b: float) -> float:
     return abs(a - b) / abs(b)
 
 
+@lru_cache(maxsize=None)
+def _compile_expr(expr: str) -> CodeType:
+    """Compile a rule condition once; the registry reuses the same expressions for every document.
+
+    The registry has already rejected conditions that ``parse_condition`` refuses, so this
+    only raises for expressions evaluated outside a registry.
+    """
+    return compile(parse_condition(expr), "<rule condition>", "eval")
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
 def _re_match(pattern: str, value: Any) -> bool:
-    return bool(re.match(pattern, str(value or "").strip()))
+    return bool(_compile_pattern(pattern).match(str(value or "").strip()))
 
 
 def _is_valid_ssn(value: Any) -> bool:
     if value is None:
         return False
     ssn = str(value).strip()
-    if not re.fullmatch(r"\d{3}-\d{2}-\d{4}", ssn):
+    if not _SSN_RE.fullmatch(ssn):
         return False
     area, group, serial = ssn.split("-")
     if area in {"000", "666", "999"}:
@@ -66,7 +90,7 @@ def _is_valid_ein(value: Any) -> bool:
     if value is None:
         return False
     raw = str(value).strip()
-    if not re.fullmatch(r"\d{2}-?\d{7}", raw):
+    if not _EIN_RE.fullmatch(raw):
         return False
     digits = raw.replace("-", "")
     if not digits.isdigit() or len(digits) != 9:
@@ -85,7 +109,7 @@ def _plausible_ein_checksum(value: Any) -> bool:
     """
     if not _is_valid_ein(value):
         return False
-    digits = re.sub(r"\D", "", str(value))
+    digits = _NON_DIGIT_RE.sub("", str(value))
     if len(set(digits)) == 1:
         return False
     return True
@@ -160,6 +184,29 @@ class RuleEngine:
         form_type: Optional[str] = None,
         tax_year: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
+        return [
+            self._build_issue(rule, env, resolved_form, resolved_year)
+            for rule, env, resolved_form, resolved_year in self._matching_rules(document, form_type, tax_year)
+        ]
+
+    def evaluate_codes(
+        self,
+        document: Mapping[str, Any],
+        *,
+        form_type: Optional[str] = None,
+        tax_year: Optional[int] = None,
+    ) -> FrozenSet[str]:
+        """Return only the ids of the rules that fire, without building finding dicts."""
+        return frozenset(
+            rule.get("id") or rule.get("code") for rule, _, _, _ in self._matching_rules(document, form_type, tax_year)
+        )
+
+    def _matching_rules(
+        self,
+        document: Mapping[str, Any],
+        form_type: Optional[str],
+        tax_year: Optional[int],
+    ) -> Iterator[Tuple[Mapping[str, Any], Dict[str, Any], str, Optional[int]]]:
         if not isinstance(document, Mapping):
             raise RuleEngineError("document must be a mapping")
 
@@ -184,16 +231,17 @@ class RuleEngine:
             supported_years=self.registry.supported_years,
         )
 
-        issues: List[Dict[str, Any]] = []
+        # Comprehensions and lambdas in conditions resolve names through globals, so the env is
+        # mirrored there too; build that copy once per document rather than once per rule.
+        safe_globals: Dict[str, Any] = {"__builtins__": {}, **env}
         for rule in rules:
             if not self._rule_matches_year(rule, resolved_year):
                 continue
             condition = (rule.get("condition") or {}).get("expr")
             if not condition:
                 continue
-            if self._evaluate_expr(condition, env):
-                issues.append(self._build_issue(rule, env, resolved_form, resolved_year))
-        return issues
+            if self._evaluate_expr(condition, env, safe_globals):
+                yield rule, env, resolved_form, resolved_year
 
     def _rule_matches_year(self, rule: Mapping[str, Any], tax_year: Optional[int]) -> bool:
         years = rule.get("tax_years")
@@ -306,11 +354,11 @@ class RuleEngine:
         }
         return env
 
-    def _evaluate_expr(self, expr: str, env: Dict[str, Any]) -> bool:
+    def _evaluate_expr(self, expr: str, env: Dict[str, Any], safe_globals: Optional[Dict[str, Any]] = None) -> bool:
         try:
-            safe_globals: Dict[str, Any] = {"__builtins__": {}}
-            safe_globals.update(env)
-            return bool(eval(expr, safe_globals, env))
+            if safe_globals is None:
+                safe_globals = {"__builtins__": {}, **env}
+            return bool(eval(_compile_expr(expr), safe_globals, env))
         except Exception:
             return False
 
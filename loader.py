@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import ast
+import sys
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 RULES_DIR = PACKAGE_ROOT / "rules"
@@ -23,9 +30,25 @@ def _is_supported_rule_file(path: Path) -> bool:
     return path.name.endswith("_core.yaml")
 
 
+@lru_cache(maxsize=None)
+def parse_condition(expr: str) -> ast.Expression:
+    """Parse a rule condition expression, rejecting dunder names and attributes.
+
+    Conditions run with an empty ``__builtins__``; blocking ``__class__``, ``__subclasses__``
+    and friends closes the usual escape from that sandbox. Cached so the registry's load-time
+    check and the engine's compile share one parse; callers must not mutate the tree.
+    """
+    tree = ast.parse(expr, mode="eval")
+    for node in ast.walk(tree):
+        name = node.attr if isinstance(node, ast.Attribute) else node.id if isinstance(node, ast.Name) else ""
+        if name.startswith("__"):
+            raise ValueError(f"rule condition may not access {name!r}")
+    return tree
+
+
 def _load_yaml_file(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or []
+        return yaml.load(handle, Loader=_YamlLoader) or []
 
 
 def _normalize_rules(source: Path, raw: Any) -> List[Dict[str, Any]]:
@@ -63,6 +86,10 @@ def _normalize_rules(source: Path, raw: Any) -> List[Dict[str, Any]]:
         rule = dict(rule)
         # Attach source file for observability/debugging.
         rule["_source"] = source.name
+        # Rule ids become finding codes; intern them so set/dict lookups compare by identity.
+        for key in ("id", "code"):
+            if isinstance(rule.get(key), str):
+                rule[key] = sys.intern(rule[key])
         rule["rule_type"] = _default_rule_type(rule.get("rule_type"))
         rule["category"] = _default_category(rule.get("category"))
         rule["summary"] = _default_summary(rule)
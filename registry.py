@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 from typing import Any, DefaultDict, Dict, Iterable, List, Mapping, Sequence
 
 try:  # pragma: no cover - allow running as script/module
-    from .loader import load_all_rules, load_year_parameters
+    from .loader import load_all_rules, load_year_parameters, parse_condition
 except ImportError:  # pragma: no cover - fallback for direct execution
-    from loader import load_all_rules, load_year_parameters
+    from loader import load_all_rules, load_year_parameters, parse_condition
 
 try:
     from .rules import w2_rules_v2
@@ -18,12 +20,25 @@ except Exception:  # pragma: no cover - optional extension
 YEAR_PARAMS = load_year_parameters()
 
 
+@lru_cache(maxsize=32)
 def get_year_params(year: int) -> Mapping[str, Any]:
+    """Parameters for ``year`` plus ``_year``; cached, so the result is read-only."""
     if year in YEAR_PARAMS:
         params = dict(YEAR_PARAMS[year])
         params["_year"] = year
-        return params
-    return {}
+        return MappingProxyType(params)
+    return MappingProxyType({})
+
+
+def _check_condition(rule: Mapping[str, Any]) -> None:
+    expr = (rule.get("condition") or {}).get("expr")
+    if not expr:
+        return
+    try:
+        parse_condition(expr)
+    except (SyntaxError, ValueError) as exc:
+        source = rule.get("_source") or "inline"
+        raise ValueError(f"Invalid condition for rule {rule.get('id')!r} ({source}): {exc}") from exc
 
 
 class RuleRegistry:
@@ -46,12 +61,13 @@ class RuleRegistry:
     def year_parameters(self) -> Dict[int, Mapping[str, Any]]:
         return dict(self._year_params)
 
-    @property
+    @cached_property
     def supported_years(self) -> Sequence[int]:
         return tuple(sorted(self._year_params.keys()))
 
     def _build_index(self) -> None:
         for rule in self._all_rules:
+            _check_condition(rule)
             forms = rule.get("form_types") or []
             if not isinstance(forms, list):
                 continue
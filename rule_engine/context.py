@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "tax_years.yaml"
 
@@ -30,32 +36,41 @@ def _validate_year_entry(year: int, data: Dict[str, Any]) -> None:
         raise ValueError(f"Config for tax year {year} missing required keys: {missing_keys}")
 
 
+def _freeze(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a year entry (and its nested sections) in read-only views."""
+    return MappingProxyType(
+        {key: MappingProxyType(value) if isinstance(value, dict) else value for key, value in data.items()}
+    )
+
+
 @lru_cache(maxsize=1)
-def load_tax_year_config() -> Dict[int, Dict[str, Any]]:
+def load_tax_year_config() -> Mapping[int, Mapping[str, Any]]:
     """
     Load tax-year configuration from config/tax_years.yaml.
 
-    Returns a dict mapping tax_year (int) -> config dict with keys:
+    Returns a read-only mapping of tax_year (int) -> config mapping with keys:
       - "limits"
       - "rates"
+
+    The result is cached and shared by every caller, so it is frozen.
     """
     if not CONFIG_PATH.exists():
         raise FileNotFoundError(f"Tax year config not found at {CONFIG_PATH}")
     with CONFIG_PATH.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = yaml.load(handle, Loader=_YamlLoader) or {}
 
-    config: Dict[int, Dict[str, Any]] = {}
+    config: Dict[int, Mapping[str, Any]] = {}
     for raw_year, data in raw.items():
         try:
             year_int = int(raw_year)
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Invalid tax year key: {raw_year}") from exc
         _validate_year_entry(year_int, data or {})
-        config[year_int] = data
-    return config
+        config[year_int] = _freeze(data)
+    return MappingProxyType(config)
 
 
-def get_context_for_year(tax_year: int) -> Dict[str, Any]:
+def get_context_for_year(tax_year: int) -> Mapping[str, Any]:
     """
     Return a context dict for the given tax year, suitable to be passed
     into rule_engine.core.apply_rules.
@@ -73,7 +88,7 @@ def get_context_for_year(tax_year: int) -> Dict[str, Any]:
 
     If the tax_year is not defined, raise a ValueError with a clear message.
     """
-    config = load_tax_year_config()
-    if tax_year not in config:
-        raise ValueError(f"Unsupported tax year: {tax_year}")
-    return config[tax_year]
+    try:
+        return load_tax_year_config()[tax_year]
+    except KeyError:
+        raise ValueError(f"Unsupported tax year: {tax_year}") from None
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 import uuid
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 
@@ -21,11 +23,14 @@ def get_path(obj: Mapping[str, Any] | None, path: str, default: Any = None) -> A
     return current
 
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
 def stripped(value: Any) -> str:
     """Strip non-digit characters from a string."""
     if value is None:
         return ""
-    return re.sub(r"\D", "", str(value))
+    return _NON_DIGIT_RE.sub("", str(value))
 
 
 _IDENT_RE = re.compile(r"\b([A-Za-z_][\w\.]*)\b")
@@ -46,10 +51,16 @@ def build_eval_expr(condition: str) -> str:
     return _IDENT_RE.sub(replacer, condition)
 
 
+@lru_cache(maxsize=None)
+def _compile_condition(condition: str) -> CodeType:
+    """Rewrite and compile a condition once; rule files repeat the same conditions for every document."""
+    return compile(build_eval_expr(condition), "<rule condition>", "eval")
+
+
 def evaluate_condition(condition: str, env: Mapping[str, Any]) -> bool:
     """Evaluate a rule condition against the provided environment."""
     try:
-        expr = build_eval_expr(condition)
+        code = _compile_condition(condition)
         allowed = {
             "__builtins__": {},
             "get": lambda obj, path: get_path(obj, path),
@@ -60,7 +71,7 @@ def evaluate_condition(condition: str, env: Mapping[str, Any]) -> bool:
             "None": None,
             "env": env,
         }
-        return bool(eval(expr, allowed))
+        return bool(eval(code, allowed))
     except Exception:
         return False
 
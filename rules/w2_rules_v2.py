@@ -22,7 +22,7 @@ RULES = [
         "description": "Taxpayer SSN is missing or not in a valid or masked format.",
         "condition": {
             "type": "expression",
-            "expr": f"not re_match('{_regex_union(MASKED_SSN_PATTERNS)}', (taxpayer_ssn or '').strip())",
+            "expr": f"not re_match(r'{_regex_union(MASKED_SSN_PATTERNS)}', (taxpayer_ssn or '').strip())",
         },
         "references": [
             {"source": "IRS W-2 Instructions", "url": "https://www.irs.gov/forms-pubs/about-form-w-2"},
@@ -37,7 +37,7 @@ RULES = [
         "description": "Employer EIN should be 9 digits (XX-XXXXXXX).",
         "condition": {
             "type": "expression",
-            "expr": "not re_match('^(\\d{2}-?\\d{7})$', (employer_ein or '').strip())",
+            "expr": "not re_match(r'^(\\d{2}-?\\d{7})$', (employer_ein or '').strip())",
         },
         "references": [
             {"source": "IRS W-2 Instructions", "url": "https://www.irs.gov/forms-pubs/about-form-w-2"},
@@ -112,7 +112,7 @@ RULES = [
         "description": "Employer EIN should be reviewed; checksum not enforced but must be 9 digits.",
         "condition": {
             "type": "expression",
-            "expr": "not re_match('^(\\d{2}-?\\d{7})$', (employer_ein or '').strip())",
+            "expr": "not re_match(r'^(\\d{2}-?\\d{7})$', (employer_ein or '').strip())",
         },
         "references": [
             {"source": "IRS W-2 Instructions", "url": "https://www.irs.gov/forms-pubs/about-form-w-2"},
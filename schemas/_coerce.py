@@ -0,0 +1,28 @@
+"""Lenient value coercion helpers shared by the schema modules."""
+
+from __future__ import annotations
+
+from itertools import chain, islice, repeat
+from typing import Any, List
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except Exception:
+        return float(default)
+
+
+def _coerce_list(values: Any) -> List[float]:
+    try:
+        return list(map(float, values))
+    except Exception:
+        return [_as_float(v, 0.0) for v in values]
+
+
+def _normalize_months(values: Any) -> List[float]:
+    if not isinstance(values, list):
+        return [0.0] * 12
+    return [_as_float(val, 0.0) for val in islice(chain(values, repeat(0.0)), 12)]
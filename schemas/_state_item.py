@@ -0,0 +1,24 @@
+"""Per-state withholding row shared by the 1099 schemas."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from ._coerce import _as_float
+
+
+@dataclass(slots=True)
+class StateItem:
+    state_code: str = ""
+    state_id_number: str = ""
+    state_tax_withheld: float = 0.0
+    state_income: float = 0.0
+
+    def normalize(self) -> Dict[str, Any]:
+        return {
+            "state_code": self.state_code,
+            "state_id_number": self.state_id_number,
+            "state_tax_withheld": _as_float(self.state_tax_withheld, 0.0),
+            "state_income": _as_float(self.state_income, 0.0),
+        }
@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     description_of_property: str = ""
     date_acquired: str = ""
@@ -49,7 +44,7 @@ class Transaction:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class B1099Document:
     doc_type: str = "1099-B"
     tax_year: Optional[int] = None
@@ -2,29 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class StateItem:
     state_code: str = ""
     state_tax_withheld: float = 0.0
 
     def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        return data
+        return {
+            "state_code": self.state_code,
+            "state_tax_withheld": _as_float(self.state_tax_withheld, 0.0),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Div1099Document:
     doc_type: str = "1099-DIV"
     tax_year: Optional[int] = None
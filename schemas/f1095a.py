@@ -2,18 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class CoveredIndividual:
     name: str = ""
     ssn_or_tin: str = ""
@@ -21,10 +16,13 @@ class CoveredIndividual:
     coverage_end: str = ""
 
     def normalize(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in _COVERED_INDIVIDUAL_FIELDS}
+
+
+_COVERED_INDIVIDUAL_FIELDS = tuple(f.name for f in fields(CoveredIndividual))
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthEntry:
     month_index: int = 0
     monthly_premium: float = 0.0
@@ -40,7 +38,7 @@ class MonthEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class F1095ADocument:
     doc_type: str = "1095-A"
     tax_year: Optional[int] = None
@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class F1098Document:
     doc_type: str = "1098"
     tax_year: Optional[int] = None
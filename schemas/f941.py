@@ -3,17 +3,39 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
+_AMOUNT_FIELDS = (
+    "line_1_num_employees",
+    "line_2_wages_tips_other_comp",
+    "line_3_income_tax_withheld",
+    "line_5a_taxable_ss_wages",
+    "line_5a_ss_tax",
+    "line_5b_taxable_ss_tips",
+    "line_5b_ss_tax_tips",
+    "line_5c_taxable_medicare_wages",
+    "line_5c_medicare_tax",
+    "line_5d_taxable_addl_medicare_wages",
+    "line_5d_addl_medicare_tax",
+    "line_6_total_taxes_before_adjustments",
+    "line_7_current_quarter_fractions_of_cents_adjustment",
+    "line_8_tip_adjustment",
+    "line_9_sick_pay_adjustment",
+    "line_10_total_taxes_after_adjustments",
+    "line_11_total_deposits_for_quarter",
+    "line_12_refundable_credits",
+    "line_13_total_taxes_after_credits",
+    "line_14_balance_due",
+    "line_15_overpayment",
+)
+_AMOUNT_GETTER = attrgetter(*_AMOUNT_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class F941Document:
     doc_type: str = "941"
     tax_year: Optional[int] = None
@@ -51,30 +73,12 @@ class F941Document:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    def __post_init__(self) -> None:
+        for name in _AMOUNT_FIELDS:
+            setattr(self, name, _as_float(getattr(self, name), 0.0))
+
     def to_document_dict(self) -> Dict[str, Any]:
-        amounts: Dict[str, Any] = {
-            "line_1_num_employees": _as_float(self.line_1_num_employees, 0.0),
-            "line_2_wages_tips_other_comp": _as_float(self.line_2_wages_tips_other_comp, 0.0),
-            "line_3_income_tax_withheld": _as_float(self.line_3_income_tax_withheld, 0.0),
-            "line_5a_taxable_ss_wages": _as_float(self.line_5a_taxable_ss_wages, 0.0),
-            "line_5a_ss_tax": _as_float(self.line_5a_ss_tax, 0.0),
-            "line_5b_taxable_ss_tips": _as_float(self.line_5b_taxable_ss_tips, 0.0),
-            "line_5b_ss_tax_tips": _as_float(self.line_5b_ss_tax_tips, 0.0),
-            "line_5c_taxable_medicare_wages": _as_float(self.line_5c_taxable_medicare_wages, 0.0),
-            "line_5c_medicare_tax": _as_float(self.line_5c_medicare_tax, 0.0),
-            "line_5d_taxable_addl_medicare_wages": _as_float(self.line_5d_taxable_addl_medicare_wages, 0.0),
-            "line_5d_addl_medicare_tax": _as_float(self.line_5d_addl_medicare_tax, 0.0),
-            "line_6_total_taxes_before_adjustments": _as_float(self.line_6_total_taxes_before_adjustments, 0.0),
-            "line_7_current_quarter_fractions_of_cents_adjustment": _as_float(self.line_7_current_quarter_fractions_of_cents_adjustment, 0.0),
-            "line_8_tip_adjustment": _as_float(self.line_8_tip_adjustment, 0.0),
-            "line_9_sick_pay_adjustment": _as_float(self.line_9_sick_pay_adjustment, 0.0),
-            "line_10_total_taxes_after_adjustments": _as_float(self.line_10_total_taxes_after_adjustments, 0.0),
-            "line_11_total_deposits_for_quarter": _as_float(self.line_11_total_deposits_for_quarter, 0.0),
-            "line_12_refundable_credits": _as_float(self.line_12_refundable_credits, 0.0),
-            "line_13_total_taxes_after_credits": _as_float(self.line_13_total_taxes_after_credits, 0.0),
-            "line_14_balance_due": _as_float(self.line_14_balance_due, 0.0),
-            "line_15_overpayment": _as_float(self.line_15_overpayment, 0.0),
-        }
+        amounts: Dict[str, Any] = dict(zip(_AMOUNT_FIELDS, _AMOUNT_GETTER(self)))
         doc: Dict[str, Any] = {
             "doc_type": self.doc_type,
             "tax_year": self.tax_year,
@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class Form5498:
     doc_type: str = "5498"
     tax_year: Optional[int] = None
@@ -55,7 +50,17 @@ class Form5498:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
-    def to_document_dict(self) -> Dict[str, Any]:
+    def __post_init__(self) -> None:
+        self.traditional_ira = bool(self.traditional_ira)
+        self.roth_ira = bool(self.roth_ira)
+        self.sep_ira = bool(self.sep_ira)
+        self.simple_ira = bool(self.simple_ira)
+        self.hsa = bool(self.hsa)
+        self.esa_cesa = bool(self.esa_cesa)
+        self.box11_required_minimum_distribution_indicator = bool(self.box11_required_minimum_distribution_indicator)
+
+    def to_document_dict(self, compact: bool = False) -> Dict[str, Any]:
+        """Return the normalized document; ``compact`` drops zero-valued amounts."""
         amounts = {
             "box1_ira_contributions": _as_float(self.box1_ira_contributions, 0.0),
             "box2_rollover_contributions": _as_float(self.box2_rollover_contributions, 0.0),
@@ -71,6 +76,8 @@ class Form5498:
             "box14_hsa_msa_contributions": _as_float(self.box14_hsa_msa_contributions, 0.0),
             "box15_other_contributions": _as_float(self.box15_other_contributions, 0.0),
         }
+        if compact:
+            amounts = {key: value for key, value in amounts.items() if value != 0.0}
         return {
             "doc_type": self.doc_type,
             "tax_year": self.tax_year,
@@ -86,15 +93,15 @@ class Form5498:
             },
             "account_number": self.account_number,
             "amounts": amounts,
-            "box11_required_minimum_distribution_indicator": bool(self.box11_required_minimum_distribution_indicator),
+            "box11_required_minimum_distribution_indicator": self.box11_required_minimum_distribution_indicator,
             "box12_rmd_date": self.box12_rmd_date,
             "flags": {
-                "traditional_ira": bool(self.traditional_ira),
-                "roth_ira": bool(self.roth_ira),
-                "sep_ira": bool(self.sep_ira),
-                "simple_ira": bool(self.simple_ira),
-                "hsa": bool(self.hsa),
-                "esa_cesa": bool(self.esa_cesa),
+                "traditional_ira": self.traditional_ira,
+                "roth_ira": self.roth_ira,
+                "sep_ira": self.sep_ira,
+                "simple_ira": self.simple_ira,
+                "hsa": self.hsa,
+                "esa_cesa": self.esa_cesa,
             },
             "ocr_quality": self.ocr_quality,
             "meta": {
@@ -5,15 +5,23 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
+_AMOUNT_FIELDS = (
+    ("box1_unemployment_compensation", "box1_unemployment_compensation"),
+    ("box2_state_local_tax_refunds", "box2_state_local_tax_refunds"),
+    ("box4_federal_income_tax_withheld", "box4_federal_income_tax_withheld"),
+    ("box5_rtaa_payments", "box5_rtaa_payments"),
+    ("box6_taxable_grants", "box6_taxable_grants"),
+    ("box7_agricultural_payments", "box7_agricultural_payments"),
+    ("box9_market_gain", "box9_market_gain"),
+    ("federal_withholding", "box4_federal_income_tax_withheld"),
+)
+_ZERO_AMOUNTS: Dict[str, float] = dict.fromkeys((key for key, _ in _AMOUNT_FIELDS), 0.0)
 
-@dataclass
+
+@dataclass(slots=True)
 class Form1099G:
     doc_type: str = "1099-G"
     tax_year: Optional[int] = None
@@ -46,17 +54,15 @@ class Form1099G:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    def __post_init__(self) -> None:
+        self.box8_trade_or_business_indicator = bool(self.box8_trade_or_business_indicator)
+
     def to_document_dict(self) -> Dict[str, Any]:
-        amounts = {
-            "box1_unemployment_compensation": _as_float(self.box1_unemployment_compensation, 0.0),
-            "box2_state_local_tax_refunds": _as_float(self.box2_state_local_tax_refunds, 0.0),
-            "box4_federal_income_tax_withheld": _as_float(self.box4_federal_income_tax_withheld, 0.0),
-            "box5_rtaa_payments": _as_float(self.box5_rtaa_payments, 0.0),
-            "box6_taxable_grants": _as_float(self.box6_taxable_grants, 0.0),
-            "box7_agricultural_payments": _as_float(self.box7_agricultural_payments, 0.0),
-            "box9_market_gain": _as_float(self.box9_market_gain, 0.0),
-            "federal_withholding": _as_float(self.box4_federal_income_tax_withheld, 0.0),
-        }
+        amounts = _ZERO_AMOUNTS.copy()
+        for key, name in _AMOUNT_FIELDS:
+            value = getattr(self, name)
+            if value:
+                amounts[key] = _as_float(value, 0.0)
         return {
             "doc_type": self.doc_type,
             "tax_year": self.tax_year,
@@ -73,10 +79,10 @@ class Form1099G:
             "account_number": self.account_number,
             "amounts": amounts,
             "box3_box2_tax_year": self.box3_box2_tax_year,
-            "box8_trade_or_business_indicator": bool(self.box8_trade_or_business_indicator),
-            "box10_state_tax_withheld": [_as_float(v, 0.0) for v in self.box10_state_tax_withheld],
+            "box8_trade_or_business_indicator": self.box8_trade_or_business_indicator,
+            "box10_state_tax_withheld": _coerce_list(self.box10_state_tax_withheld),
             "box11_state_id": list(self.box11_state_id),
-            "box12_state_income": [_as_float(v, 0.0) for v in self.box12_state_income],
+            "box12_state_income": _coerce_list(self.box12_state_income),
             "ocr_quality": self.ocr_quality,
             "meta": {
                 "source_pdf_path": self.source_pdf_path,
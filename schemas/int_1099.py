@@ -2,30 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
+from ._state_item import StateItem
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
-class StateItem:
-    state_code: str = ""
-    state_id_number: str = ""
-    state_tax_withheld: float = 0.0
-
-    def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        return data
-
-
-@dataclass
+@dataclass(slots=True)
 class Int1099Document:
     doc_type: str = "1099-INT"
     tax_year: Optional[int] = None
@@ -109,7 +93,7 @@ class Int1099Document:
             "box_6_foreign_country_or_ust_possession": self.box_6_foreign_country,
             "box_14_tax_exempt_cusip": self.box_14_tax_exempt_cusip,
             "box_15_state": list(self.box_15_state),
-            "box_16_state_tax_withheld": [_as_float(v, 0.0) for v in self.box_16_state_tax_withheld],
+            "box_16_state_tax_withheld": _coerce_list(self.box_16_state_tax_withheld),
             "box_17_state_id": list(self.box_17_state_id),
             "amounts": amounts,
             "state_items": [item.normalize() for item in self.state_items],
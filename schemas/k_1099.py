@@ -2,40 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _normalize_months
+from ._state_item import StateItem
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-def _normalize_months(values: Any) -> List[float]:
-    if not isinstance(values, list):
-        return [0.0] * 12
-    normalized: List[float] = []
-    for val in values[:12]:
-        normalized.append(_as_float(val, 0.0))
-    while len(normalized) < 12:
-        normalized.append(0.0)
-    return normalized
-
-
-@dataclass
-class StateItem:
-    state_code: str = ""
-    state_tax_withheld: float = 0.0
-
-    def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        return data
-
-
-@dataclass
+@dataclass(slots=True)
 class K1099Document:
     doc_type: str = "1099-K"
     tax_year: Optional[int] = None
@@ -2,32 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
+from ._state_item import StateItem
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
-class StateItem:
-    state_code: str = ""
-    state_id_number: str = ""
-    state_tax_withheld: float = 0.0
-    state_income: float = 0.0
-
-    def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        data["state_income"] = _as_float(self.state_income, 0.0)
-        return data
-
-
-@dataclass
+@dataclass(slots=True)
 class Nec1099Document:
     doc_type: str = "1099-NEC"
     tax_year: Optional[int] = None
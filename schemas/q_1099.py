@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class Form1099Q:
     doc_type: str = "1099-Q"
     tax_year: Optional[int] = None
@@ -46,6 +41,13 @@ class Form1099Q:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    def __post_init__(self) -> None:
+        self.box4_trustee_to_trustee_transfer = bool(self.box4_trustee_to_trustee_transfer)
+        self.box5_qualified_tuition_program = bool(self.box5_qualified_tuition_program)
+        self.box6_life_insurance_distributed = bool(self.box6_life_insurance_distributed)
+        self.qualified_tuition_program_529 = bool(self.qualified_tuition_program_529)
+        self.coverdell_esa = bool(self.coverdell_esa)
+
     def to_document_dict(self) -> Dict[str, Any]:
         amounts = {
             "box1_gross_distribution": _as_float(self.box1_gross_distribution, 0.0),
@@ -67,14 +69,14 @@ class Form1099Q:
             },
             "account_number": self.account_number,
             "amounts": amounts,
-            "box4_trustee_to_trustee_transfer": bool(self.box4_trustee_to_trustee_transfer),
-            "box5_qualified_tuition_program": bool(self.box5_qualified_tuition_program),
-            "box6_life_insurance_distributed": bool(self.box6_life_insurance_distributed),
-            "qualified_tuition_program_529": bool(self.qualified_tuition_program_529),
-            "coverdell_esa": bool(self.coverdell_esa),
-            "state_tax_withheld": [_as_float(v, 0.0) for v in self.state_tax_withheld],
+            "box4_trustee_to_trustee_transfer": self.box4_trustee_to_trustee_transfer,
+            "box5_qualified_tuition_program": self.box5_qualified_tuition_program,
+            "box6_life_insurance_distributed": self.box6_life_insurance_distributed,
+            "qualified_tuition_program_529": self.qualified_tuition_program_529,
+            "coverdell_esa": self.coverdell_esa,
+            "state_tax_withheld": _coerce_list(self.state_tax_withheld),
             "state_id": list(self.state_id),
-            "state_income": [_as_float(v, 0.0) for v in self.state_income],
+            "state_income": _coerce_list(self.state_income),
             "ocr_quality": self.ocr_quality,
             "meta": {
                 "source_pdf_path": self.source_pdf_path,
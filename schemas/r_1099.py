@@ -2,31 +2,43 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
+_AMOUNT_FIELDS = (
+    "box_1_gross_distribution",
+    "box_2a_taxable_amount",
+    "box_3_capital_gain_included",
+    "box_4_federal_income_tax_withheld",
+    "box_5_employee_contributions_or_insurance_premiums",
+    "box_6_net_unrealized_appreciation",
+    "box_8_other",
+    "box_9a_total_distribution_pct",
+    "box_9b_total_employee_contributions",
+    "box_10_amount_allocable_to_IRR",
+)
+_AMOUNT_GETTER = attrgetter(*_AMOUNT_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class StateItem:
     state_code: str = ""
     state_tax_withheld: float = 0.0
     state_distribution_amount: float = 0.0
 
     def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        data["state_distribution_amount"] = _as_float(self.state_distribution_amount, 0.0)
-        return data
+        return {
+            "state_code": self.state_code,
+            "state_tax_withheld": _as_float(self.state_tax_withheld, 0.0),
+            "state_distribution_amount": _as_float(self.state_distribution_amount, 0.0),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class R1099Document:
     doc_type: str = "1099-R"
     tax_year: Optional[int] = None
@@ -49,7 +61,7 @@ class R1099Document:
     box_4_federal_income_tax_withheld: float = 0.0
     box_5_employee_contributions_or_insurance_premiums: float = 0.0
     box_6_net_unrealized_appreciation: float = 0.0
-    box_7_distribution_codes: List[str] = field(default_factory=list)
+    box_7_distribution_codes: Optional[List[str]] = None
     box_7_ira_sep_simple_indicator: bool = False
     box_8_other: float = 0.0
     box_9a_total_distribution_pct: float = 0.0
@@ -58,32 +70,28 @@ class R1099Document:
     box_11_first_year_designated_roth: Optional[int] = None
     box_12_fatca_filing_requirement: bool = False
     box_13_date_of_payment: str = ""
-    box_14_state_tax_withheld: List[float] = field(default_factory=list)
-    box_15_state_id: List[str] = field(default_factory=list)
-    box_16_state_distribution: List[float] = field(default_factory=list)
+    box_14_state_tax_withheld: Optional[List[float]] = None
+    box_15_state_id: Optional[List[str]] = None
+    box_16_state_distribution: Optional[List[float]] = None
 
-    state_items: List[StateItem] = field(default_factory=list)
+    state_items: Optional[List[StateItem]] = None
 
     ocr_quality: Optional[float] = None
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    _box_7_distribution_code: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.box_2b_taxable_amount_not_determined = bool(self.box_2b_taxable_amount_not_determined)
+        self.box_2b_total_distribution = bool(self.box_2b_total_distribution)
+        self.box_7_ira_sep_simple_indicator = bool(self.box_7_ira_sep_simple_indicator)
+        self.box_12_fatca_filing_requirement = bool(self.box_12_fatca_filing_requirement)
+        self._box_7_distribution_code = " ".join(self.box_7_distribution_codes or ())
+
     def to_document_dict(self) -> Dict[str, Any]:
-        amounts = {
-            "box_1_gross_distribution": _as_float(self.box_1_gross_distribution, 0.0),
-            "box_2a_taxable_amount": _as_float(self.box_2a_taxable_amount, 0.0),
-            "box_3_capital_gain_included": _as_float(self.box_3_capital_gain_included, 0.0),
-            "box_4_federal_income_tax_withheld": _as_float(self.box_4_federal_income_tax_withheld, 0.0),
-            "box_5_employee_contributions_or_insurance_premiums": _as_float(
-                self.box_5_employee_contributions_or_insurance_premiums, 0.0
-            ),
-            "box_6_net_unrealized_appreciation": _as_float(self.box_6_net_unrealized_appreciation, 0.0),
-            "box_8_other": _as_float(self.box_8_other, 0.0),
-            "box_9a_total_distribution_pct": _as_float(self.box_9a_total_distribution_pct, 0.0),
-            "box_9b_total_employee_contributions": _as_float(self.box_9b_total_employee_contributions, 0.0),
-            "box_10_amount_allocable_to_IRR": _as_float(self.box_10_amount_allocable_to_IRR, 0.0),
-            "federal_withholding": _as_float(self.box_4_federal_income_tax_withheld, 0.0),
-        }
+        amounts: Dict[str, Any] = dict(zip(_AMOUNT_FIELDS, map(_as_float, _AMOUNT_GETTER(self))))
+        amounts["federal_withholding"] = amounts["box_4_federal_income_tax_withheld"]
         doc: Dict[str, Any] = {
             "doc_type": self.doc_type,
             "tax_year": self.tax_year,
@@ -99,18 +107,18 @@ class R1099Document:
             },
             "account_number": self.account_number,
             "amounts": amounts,
-            "box_2b_taxable_amount_not_determined": bool(self.box_2b_taxable_amount_not_determined),
-            "box_2b_total_distribution": bool(self.box_2b_total_distribution),
-            "box_7_distribution_code": " ".join(self.box_7_distribution_codes) if self.box_7_distribution_codes else "",
-            "box_7_distribution_codes": list(self.box_7_distribution_codes),
-            "box_7_ira_sep_simple_indicator": bool(self.box_7_ira_sep_simple_indicator),
+            "box_2b_taxable_amount_not_determined": self.box_2b_taxable_amount_not_determined,
+            "box_2b_total_distribution": self.box_2b_total_distribution,
+            "box_7_distribution_code": self._box_7_distribution_code,
+            "box_7_distribution_codes": self.box_7_distribution_codes or [],
+            "box_7_ira_sep_simple_indicator": self.box_7_ira_sep_simple_indicator,
             "box_11_first_year_designated_roth": self.box_11_first_year_designated_roth,
-            "box_12_fatca_filing_requirement": bool(self.box_12_fatca_filing_requirement),
+            "box_12_fatca_filing_requirement": self.box_12_fatca_filing_requirement,
             "box_13_date_of_payment": self.box_13_date_of_payment,
-            "box_14_state_tax_withheld": [ _as_float(v, 0.0) for v in self.box_14_state_tax_withheld ],
-            "box_15_state_id": list(self.box_15_state_id),
-            "box_16_state_distribution": [ _as_float(v, 0.0) for v in self.box_16_state_distribution ],
-            "state_items": [item.normalize() for item in self.state_items],
+            "box_14_state_tax_withheld": _coerce_list(self.box_14_state_tax_withheld or ()),
+            "box_15_state_id": self.box_15_state_id or [],
+            "box_16_state_distribution": _coerce_list(self.box_16_state_distribution or ()),
+            "state_items": [item.normalize() for item in self.state_items or ()],
             "ocr_quality": self.ocr_quality,
             "meta": {
                 "source_pdf_path": self.source_pdf_path,
@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class Form1099S:
     doc_type: str = "1099-S"
     tax_year: Optional[int] = None
@@ -46,11 +41,17 @@ class Form1099S:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    def __post_init__(self) -> None:
+        self.box2_property_or_services = bool(self.box2_property_or_services)
+        self.box3_recipient_is_transferor = bool(self.box3_recipient_is_transferor)
+        self.box5_transferor_is_foreign = bool(self.box5_transferor_is_foreign)
+
     def to_document_dict(self) -> Dict[str, Any]:
+        federal_withholding = _as_float(self.box4_federal_income_tax_withheld, 0.0)
         amounts = {
             "box1_gross_proceeds": _as_float(self.box1_gross_proceeds, 0.0),
-            "box4_federal_income_tax_withheld": _as_float(self.box4_federal_income_tax_withheld, 0.0),
-            "federal_withholding": _as_float(self.box4_federal_income_tax_withheld, 0.0),
+            "box4_federal_income_tax_withheld": federal_withholding,
+            "federal_withholding": federal_withholding,
         }
         return {
             "doc_type": self.doc_type,
@@ -70,12 +71,12 @@ class Form1099S:
             "property_desc": self.property_desc,
             "closing_date": self.closing_date,
             "amounts": amounts,
-            "box2_property_or_services": bool(self.box2_property_or_services),
-            "box3_recipient_is_transferor": bool(self.box3_recipient_is_transferor),
-            "box5_transferor_is_foreign": bool(self.box5_transferor_is_foreign),
-            "state_tax_withheld": [_as_float(v, 0.0) for v in self.state_tax_withheld],
-            "state_id": list(self.state_id),
-            "state_income": [_as_float(v, 0.0) for v in self.state_income],
+            "box2_property_or_services": self.box2_property_or_services,
+            "box3_recipient_is_transferor": self.box3_recipient_is_transferor,
+            "box5_transferor_is_foreign": self.box5_transferor_is_foreign,
+            "state_tax_withheld": _coerce_list(self.state_tax_withheld),
+            "state_id": list(self.state_id or []),
+            "state_income": _coerce_list(self.state_income),
             "ocr_quality": self.ocr_quality,
             "meta": {
                 "source_pdf_path": self.source_pdf_path,
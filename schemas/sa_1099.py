@@ -5,15 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float, _coerce_list
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class Form1099SA:
     doc_type: str = "1099-SA"
     tax_year: Optional[int] = None
@@ -46,13 +41,19 @@ class Form1099SA:
     source_pdf_path: str = ""
     extraction_engine_version: str = ""
 
+    def __post_init__(self) -> None:
+        self.hsa = bool(self.hsa)
+        self.archer_msa = bool(self.archer_msa)
+        self.ma_msa = bool(self.ma_msa)
+
     def to_document_dict(self) -> Dict[str, Any]:
+        federal_withholding = _as_float(self.box4_federal_income_tax_withheld, 0.0)
         amounts = {
             "box1_gross_distribution": _as_float(self.box1_gross_distribution, 0.0),
             "box2_earnings_on_excess_contributions": _as_float(self.box2_earnings_on_excess_contributions, 0.0),
-            "box4_federal_income_tax_withheld": _as_float(self.box4_federal_income_tax_withheld, 0.0),
+            "box4_federal_income_tax_withheld": federal_withholding,
             "box5_fair_market_value_hsa_msa": _as_float(self.box5_fair_market_value_hsa_msa, 0.0),
-            "federal_withholding": _as_float(self.box4_federal_income_tax_withheld, 0.0),
+            "federal_withholding": federal_withholding,
         }
         return {
             "doc_type": self.doc_type,
@@ -70,12 +71,12 @@ class Form1099SA:
             "account_number": self.account_number,
             "amounts": amounts,
             "box3_distribution_code": self.box3_distribution_code,
-            "hsa": bool(self.hsa),
-            "archer_msa": bool(self.archer_msa),
-            "ma_msa": bool(self.ma_msa),
-            "state_tax_withheld": [_as_float(v, 0.0) for v in self.state_tax_withheld],
-            "state_id": list(self.state_id),
-            "state_income": [_as_float(v, 0.0) for v in self.state_income],
+            "hsa": self.hsa,
+            "archer_msa": self.archer_msa,
+            "ma_msa": self.ma_msa,
+            "state_tax_withheld": _coerce_list(self.state_tax_withheld),
+            "state_id": list(self.state_id or []),
+            "state_income": _coerce_list(self.state_income),
             "ocr_quality": self.ocr_quality,
             "meta": {
                 "source_pdf_path": self.source_pdf_path,
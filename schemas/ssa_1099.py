@@ -2,30 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ._coerce import _as_float
 
-def _as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return float(default)
 
-
-@dataclass
+@dataclass(slots=True)
 class StateItem:
     state_code: str = ""
     state_tax_withheld: float = 0.0
     state_id_number: str = ""
 
     def normalize(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["state_tax_withheld"] = _as_float(self.state_tax_withheld, 0.0)
-        return data
+        return {
+            "state_code": self.state_code,
+            "state_tax_withheld": _as_float(self.state_tax_withheld, 0.0),
+            "state_id_number": self.state_id_number,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SSA1099Document:
     doc_type: str = "SSA-1099"
     tax_year: Optional[int] = None
@@ -53,15 +50,16 @@ class SSA1099Document:
     extraction_engine_version: str = ""
 
     def to_document_dict(self) -> Dict[str, Any]:
+        federal_withholding = _as_float(self.box_6_voluntary_federal_tax_withheld, 0.0)
         amounts = {
             "box_3_benefits_paid": _as_float(self.box_3_benefits_paid, 0.0),
             "box_4_benefits_repaid": _as_float(self.box_4_benefits_repaid, 0.0),
             "box_5_net_benefits": _as_float(self.box_5_net_benefits, 0.0),
-            "box_6_voluntary_federal_tax_withheld": _as_float(self.box_6_voluntary_federal_tax_withheld, 0.0),
+            "box_6_voluntary_federal_tax_withheld": federal_withholding,
             "box_7_medicare_premiums": _as_float(self.box_7_medicare_premiums, 0.0),
             "box_8_other_deductions_or_adjustments": _as_float(self.box_8_other_deductions_or_adjustments, 0.0),
             "box_9_state_repayment": _as_float(self.box_9_state_repayment, 0.0),
-            "federal_withholding": _as_float(self.box_6_voluntary_federal_tax_withheld, 0.0),
+            "federal_withholding": federal_withholding,
         }
         return {
             "doc_type": self.doc_type,
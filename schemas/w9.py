@@ -10,7 +10,7 @@ def _as_str(value: Any) -> str:
     return "" if value is None else str(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class W9Document:
     doc_type: str = "W-9"
     tax_year: Optional[int] = None
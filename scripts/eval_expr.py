@@ -0,0 +1,68 @@
+"""Evaluate rule condition expressions against a sample document, for debugging rules.
+
+Example:
+    python scripts/eval_expr.py --sample sample_data/f1098_issues.json \
+        --expr "recipient_tin" --expr "missing(recipient_tin)"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# Support running as a script without installing the package
+try:
+    from engine import RuleEngine, _compile_expr
+except ImportError:  # pragma: no cover - runtime convenience
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from engine import RuleEngine, _compile_expr  # type: ignore
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evaluate rule expressions against a sample document.")
+    parser.add_argument("--sample", required=True, help="Path to a JSON document (e.g. sample_data/*.json).")
+    parser.add_argument(
+        "--expr",
+        action="append",
+        required=True,
+        help="Expression to evaluate; repeat to evaluate several against one engine and environment.",
+    )
+    parser.add_argument("--form-type", help="Override the document's doc_type.")
+    parser.add_argument("--tax-year", type=int, help="Override the document's tax_year.")
+    return parser.parse_args()
+
+
+def build_env(engine: RuleEngine, doc: Dict[str, Any], form_type: str, tax_year: Any) -> Dict[str, Any]:
+    return engine._build_environment(
+        doc,
+        form_type,
+        tax_year,
+        engine.registry.get_year_params(tax_year),
+        supported_years=engine.registry.supported_years,
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    doc = json.loads(Path(args.sample).read_text(encoding="utf-8"))
+    form_type = (args.form_type or doc.get("doc_type") or doc.get("form_type") or "").upper()
+    tax_year = args.tax_year or doc.get("tax_year")
+
+    engine = RuleEngine()
+    env = build_env(engine, doc, form_type, tax_year)
+    # Same evaluation setup as RuleEngine, minus the bool() coercion and error swallowing.
+    safe_globals: Dict[str, Any] = {"__builtins__": {}, **env}
+    for expr in args.expr:
+        try:
+            value = eval(_compile_expr(expr), safe_globals, env)
+        except Exception as exc:
+            print(f"{expr!r} -> error: {exc!r}")
+        else:
+            print(f"{expr!r} -> {value!r}")
+
+
+if __name__ == "__main__":
+    main()
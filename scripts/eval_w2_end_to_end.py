@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from heapq import nsmallest
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 # Support running as a script without installing the package
 try:
@@ -15,16 +20,21 @@ except ImportError:  # pragma: no cover - runtime convenience
     sys.path.append(str(Path(__file__).resolve().parent.parent))
     from auditor_inference.inference import audit_document, load_chunk_index  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 EVAL_DIR = ROOT / "sample_data" / "eval_w2"
 CHUNK_INDEX_PATH = ROOT / "sample_data" / "chunk_index.jsonl"
 
-EXPECTED_RULE_CODES: Dict[str, Set[str]] = {
-    "w2_zero_withholding.json": {"W2_ZERO_FED_WITHHOLDING"},
-    "w2_normal_withholding.json": set(),
-    "w2_ein_malformed.json": {"W2_EIN_MALFORMED_OR_MISSING"},
-    "w2_ss_wages_mismatch.json": {"W2_SS_WAGES_MISMATCH"},
-    "w2_fica_over_cap.json": {"W2_FICA_OVER_CAP", "W2_SOCSEC_WAGE_CAP"},
+EXPECTED_RULE_CODES: Dict[str, FrozenSet[str]] = {
+    "w2_zero_withholding.json": frozenset({"W2_ZERO_FED_WITHHOLDING"}),
+    "w2_normal_withholding.json": frozenset(),
+    "w2_ein_malformed.json": frozenset({"W2_EIN_MALFORMED_OR_MISSING"}),
+    "w2_ss_wages_mismatch.json": frozenset({"W2_SS_WAGES_MISMATCH"}),
+    "w2_fica_over_cap.json": frozenset({"W2_FICA_OVER_CAP", "W2_SOCSEC_WAGE_CAP"}),
 }
 
 
@@ -32,8 +42,36 @@ def load_docs() -> List[Path]:
     return sorted(EVAL_DIR.glob("*.json"))
 
 
+def load_doc(doc_path: Path) -> Dict:
+    if orjson is not None:
+        return orjson.loads(doc_path.read_bytes())
+    return json.loads(doc_path.read_text(encoding="utf-8"))
+
+
 def summarize_codes(findings: List[Dict]) -> Set[str]:
-    return {f.get("code") for f in findings if "code" in f}
+    return {f["code"] for f in findings if "code" in f}
+
+
+def audit_one(
+    doc_path: Path, device: str, skip_llm: bool, doc: Optional[Dict] = None
+) -> Tuple[str, Set[str], Set[str], Set[str]]:
+    if doc is None:
+        doc = load_doc(doc_path)
+    result = audit_document(
+        doc=doc,
+        chunk_index_path=str(CHUNK_INDEX_PATH),
+        base_model="mistralai/Mistral-7B-v0.1",
+        adapter_dir=str(ROOT / "outputs" / "auditor_mistral_lora"),
+        device=device,
+        max_new_tokens=256,
+        use_4bit=False,
+        skip_llm=skip_llm,
+    )
+
+    rule_codes = summarize_codes(result.get("rule_findings", []))
+    llm_codes = summarize_codes(result.get("llm_findings", []))
+    merged_codes = summarize_codes(result.get("merged_findings", []))
+    return doc_path.name, rule_codes, llm_codes, merged_codes
 
 
 def main():
@@ -41,6 +79,12 @@ def main():
     parser.add_argument("--device", default="cuda", help="Device for local LLM (if used). Default: cuda")
     parser.add_argument("--skip-llm", action="store_true", help="Run in deterministic-only mode.")
     parser.add_argument("--top", type=int, default=5, help="Max findings to display per category.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Audit docs in parallel processes (only with --skip-llm). 0 = one per CPU. Default: 1",
+    )
     args = parser.parse_args()
 
     chunk_index = load_chunk_index(CHUNK_INDEX_PATH)
@@ -53,36 +97,36 @@ def main():
     print(f"Chunk index size: {len(chunk_index)} entries")
     print("-" * 60)
 
-    for doc_path in docs:
-        doc = json.loads(doc_path.read_text(encoding="utf-8"))
-        result = audit_document(
-            doc=doc,
-            chunk_index_path=str(CHUNK_INDEX_PATH),
-            base_model="mistralai/Mistral-7B-v0.1",
-            adapter_dir=str(ROOT / "outputs" / "auditor_mistral_lora"),
-            device=args.device,
-            max_new_tokens=256,
-            use_4bit=False,
-            skip_llm=args.skip_llm,
-        )
-
-        rule_codes = summarize_codes(result.get("rule_findings", []))
-        llm_codes = summarize_codes(result.get("llm_findings", []))
-        merged_codes = summarize_codes(result.get("merged_findings", []))
-
-        expected = EXPECTED_RULE_CODES.get(doc_path.name)
-        status = "PASS"
-        if expected is not None and rule_codes != expected:
-            status = "FAIL"
-
-        print(f"{status} {doc_path.name} (rule codes: {sorted(rule_codes)})")
-        if expected is not None:
-            print(f"  expected: {sorted(expected)}")
-        if llm_codes:
-            print(f"  llm codes: {sorted(list(llm_codes))[: args.top]}")
-        if merged_codes:
-            print(f"  merged codes: {sorted(list(merged_codes))[: args.top]}")
-        print("-" * 60)
+    workers = args.workers or os.cpu_count() or 1
+    if not args.skip_llm:
+        # The local LLM is loaded per process; keep a single copy on the device.
+        workers = 1
+
+    run = partial(audit_one, device=args.device, skip_llm=args.skip_llm)
+    with ExitStack() as stack:
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = executor.map(run, docs)
+        else:
+            # Read ahead on threads so file I/O overlaps with the audits.
+            io_executor = stack.enter_context(ThreadPoolExecutor(max_workers=4))
+            prefetched = io_executor.map(load_doc, docs)
+            results = (run(doc_path, doc=doc) for doc_path, doc in zip(docs, prefetched))
+
+        for name, rule_codes, llm_codes, merged_codes in results:
+            expected = EXPECTED_RULE_CODES.get(name)
+            status = "PASS"
+            if expected is not None and rule_codes != expected:
+                status = "FAIL"
+
+            print(f"{status} {name} (rule codes: {sorted(rule_codes)})")
+            if expected is not None:
+                print(f"  expected: {sorted(expected)}")
+            if llm_codes:
+                print(f"  llm codes: {nsmallest(args.top, llm_codes)}")
+            if merged_codes:
+                print(f"  merged codes: {nsmallest(args.top, merged_codes)}")
+            print("-" * 60)
 
 
 if __name__ == "__main__":
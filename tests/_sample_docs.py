@@ -0,0 +1,48 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+SAMPLE_DATA = Path(__file__).resolve().parent.parent / "sample_data"
+
+
+def _parse(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=None)
+def _raw_docs() -> Dict[str, bytes]:
+    """Bytes of every sample_data/*.json file, read in a single directory scan."""
+    return {path.name: path.read_bytes() for path in SAMPLE_DATA.glob("*.json")}
+
+
+def read_doc_bytes(name: str) -> bytes:
+    """Raw bytes of a sample document, e.g. for upload endpoints."""
+    return _raw_docs()[name]
+
+
+def load_doc(name: str) -> dict:
+    """Parse a sample document; each call returns a fresh dict the test may mutate."""
+    return _parse(read_doc_bytes(name))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def load_all() -> Dict[str, Mapping[str, Any]]:
+    """Parse every sample document, keyed by file name, as read-only views safe to share."""
+    return {name: _freeze(_parse(raw)) for name, raw in _raw_docs().items()}
@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+# Cheap password hashes for register/login round-trips; read when backend.security is imported.
+os.environ.setdefault("PBKDF2_ROUNDS", "1000")
+# In-memory SQLite: no commit fsyncs, and runs leave dev.db untouched.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+
+@pytest.fixture(scope="session")
+def rule_engine():
+    """Shared RuleEngine; building the default registry loads every rule file."""
+    from engine import RuleEngine
+
+    return RuleEngine()
+
+
+@pytest.fixture(scope="session")
+def sample_doc():
+    """Lookup for sample_data documents, all read in one directory scan and parsed once per run.
+
+    Documents are read-only views (lists become tuples); use ``_sample_docs.load_doc`` for a
+    mutable private copy.
+    """
+    from _sample_docs import load_all
+
+    return load_all().__getitem__
+
+
+@pytest.fixture(scope="session")
+def findings_for(rule_engine):
+    """Evaluate a shared sample document once per run and hand every caller the same findings.
+
+    Keyed by ``id(doc)``, which is stable because ``sample_doc`` keeps its dicts alive (the
+    cache holds a reference too). Tests must not mutate the returned findings.
+    """
+    cache = {}
+
+    def _findings(doc):
+        key = id(doc)
+        if key not in cache:
+            cache[key] = (doc, rule_engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year")))
+        return cache[key][1]
+
+    return _findings
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the backend schema once per test run and clear tenant data left by earlier runs."""
+    from backend.db import engine, init_db
+    from backend.db_models import ClientORM, EngagementORM, FirmMembershipORM, FirmORM, UserORM
+
+    init_db()
+    with engine.begin() as conn:
+        for model in (EngagementORM, ClientORM, FirmMembershipORM, UserORM, FirmORM):
+            conn.execute(model.__table__.delete())
+
+
+@pytest.fixture(scope="session")
+def demo_data(db_schema):
+    """Seed the demo firm/user/client once; seed_demo_data skips rows that already exist."""
+    from backend.seed import seed_demo_data
+
+    seed_demo_data()
+
+
+@pytest.fixture(scope="session")
+def api_client(db_schema):
+    """One TestClient (and app lifespan) for the whole run, with auth bypassed by default.
+
+    backend.app reads AUTH_BYPASS once at import for its Firebase-guarded routes, so the
+    variable is set before the import. backend.deps re-reads it per request; tests that
+    exercise real tokens use the ``auth_required`` fixture.
+    """
+    from fastapi.testclient import TestClient
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AUTH_BYPASS", "true")
+        from backend import app as app_module
+
+        with TestClient(app_module.app) as client:
+            yield client
+
+
+@pytest.fixture
+def auth_required(monkeypatch):
+    """Turn AUTH_BYPASS off for one test so requests need a bearer token."""
+    monkeypatch.setenv("AUTH_BYPASS", "false")
+
+
+@pytest.fixture
+def db_transaction(db_schema):
+    """Run the test inside one outer transaction that is rolled back afterwards.
+
+    ``SessionLocal`` (and therefore the app's ``get_db`` dependency) is rebound to a single
+    connection for the duration of the test. Sessions join its transaction in
+    ``rollback_only`` mode, so their ``commit()`` calls leave the outer transaction open.
+    """
+    from backend.db import SessionLocal, engine
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    saved_kw = dict(SessionLocal.kw)
+    SessionLocal.configure(bind=connection, join_transaction_mode="rollback_only")
+    try:
+        yield connection
+    finally:
+        SessionLocal.kw.clear()
+        SessionLocal.kw.update(saved_kw)
+        transaction.rollback()
+        connection.close()
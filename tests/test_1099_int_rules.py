@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pytest
 import yaml
 
 from rule_engine import apply_rules
@@ -9,13 +10,17 @@ from rule_engine.context import get_context_for_year
 RULES_PATH = Path(__file__).resolve().parent.parent / "rules" / "1099_int.yaml"
 
 
-def load_rules():
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="module")
+def rules():
     with RULES_PATH.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or []
+        return yaml.load(handle, Loader=_SAFE_LOADER) or []
 
 
-def test_1099_int_multiple_findings_on_suspicious_form():
-    rules = load_rules()
+def test_1099_int_multiple_findings_on_suspicious_form(rules):
     document = {
         "doc_id": "uuid-1099-1",
         "doc_type": "1099-INT",
@@ -44,8 +49,7 @@ def test_1099_int_multiple_findings_on_suspicious_form():
     assert "INT_NEGATIVE_INTEREST_OR_TAX" in codes
 
 
-def test_1099_int_clean_document_has_no_findings():
-    rules = load_rules()
+def test_1099_int_clean_document_has_no_findings(rules):
     document = {
         "doc_id": "uuid-1099-2",
         "doc_type": "1099-INT",
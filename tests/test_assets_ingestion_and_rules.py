@@ -1,18 +1,18 @@
 from io import BytesIO
 from textwrap import dedent
 
+import pytest
+
 from backend.assets_ingestion import parse_assets_csv, parse_depreciation_csv
 from backend.assets_rules import run_assets_rules
 from backend.accounting_store import save_assets, save_depreciation_entries
-from backend.db import init_db
 
 
 def make_bytes(s: str) -> BytesIO:
     return BytesIO(dedent(s).lstrip().encode("utf-8"))
 
 
-def test_assets_ingestion_and_rules_basic():
-    init_db()
+def test_assets_ingestion_and_rules_basic(db_schema):
     engagement_id = "eng-assets-1"
 
     assets_csv = make_bytes(
@@ -41,3 +41,14 @@ def test_assets_ingestion_and_rules_basic():
     assert "ASSET_USEFUL_LIFE_EXCEEDS_POLICY" in codes
     assert "ASSET_NO_DEPRECIATION_RECORDED" in codes
     assert "ASSET_DISPOSAL_WITH_NONZERO_NBV" in codes
+
+
+@pytest.mark.parametrize("raw", ["20240115", "2024-W03-1"])
+def test_assets_ingestion_rejects_non_dashed_dates(raw):
+    assets_csv = make_bytes(
+        f"""asset_code,description,category,acquisition_date,acquisition_cost,useful_life_years,disposal_date
+        A1,Machine 1,Plant,{raw},100000,5,
+        """
+    )
+    with pytest.raises(ValueError):
+        parse_assets_csv(assets_csv)
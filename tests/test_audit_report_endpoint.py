@@ -1,23 +1,10 @@
-import os
-from pathlib import Path
+from _sample_docs import read_doc_bytes
 
-from fastapi.testclient import TestClient
 
-# Bypass auth for tests before importing the app
-os.environ["AUTH_BYPASS"] = "true"
-
-from backend import app as app_module  # noqa: E402
-
-
-ROOT = Path(__file__).resolve().parent.parent
-client = TestClient(app_module.app)
-
-
-def test_audit_report_returns_html():
-    payload_path = ROOT / "sample_data" / "w2_issues.json"
-    resp = client.post(
+def test_audit_report_returns_html(api_client):
+    resp = api_client.post(
         "/audit-report",
-        files={"file": ("w2_issues.json", payload_path.read_bytes(), "application/json")},
+        files={"file": ("w2_issues.json", read_doc_bytes("w2_issues.json"), "application/json")},
     )
     assert resp.status_code == 200
     content_type = resp.headers.get("content-type", "")
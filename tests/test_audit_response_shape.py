@@ -1,25 +1,11 @@
-import os
-from pathlib import Path
-
-from fastapi.testclient import TestClient
-
+from _sample_docs import read_doc_bytes
 from engine import rule_engine
 
-# Ensure local auth bypass is enabled before importing the app
-os.environ["AUTH_BYPASS"] = "true"
-
-from backend import app as app_module  # noqa: E402
-
-
-ROOT = Path(__file__).resolve().parent.parent
-client = TestClient(app_module.app)
-
 
-def test_audit_endpoint_returns_structured_response():
-    payload_path = ROOT / "sample_data" / "w2_issues.json"
-    resp = client.post(
+def test_audit_endpoint_returns_structured_response(api_client):
+    resp = api_client.post(
         "/audit-document",
-        files={"file": ("w2_issues.json", payload_path.read_bytes(), "application/json")},
+        files={"file": ("w2_issues.json", read_doc_bytes("w2_issues.json"), "application/json")},
     )
     assert resp.status_code == 200
     body = resp.json()
@@ -1,13 +1,16 @@
-import io
 from datetime import date, time
 from decimal import Decimal
 
 from backend.accounting_models import Transaction, TransactionLine
 from backend.accounting_store import clear_engagement, save_transactions, save_bank_entries
-from backend.bank_ingestion import parse_bank_csv
+from backend.bank_ingestion import parse_bank_csv, parse_bank_rows
 from backend.bank_rules import run_bank_rules, LARGE_AMOUNT_THRESHOLD
 from backend.domain_rules import DomainFinding
 
+_ZERO = Decimal("0")
+_NEG_1500 = Decimal("-1500")
+_LARGE_OUTFLOW = Decimal(f"-{LARGE_AMOUNT_THRESHOLD}")
+
 
 def test_bank_ingestion_and_rules():
     engagement_id = "eng-bank"
@@ -22,8 +25,7 @@ def test_bank_ingestion_and_rules():
             "2024-01-07,Large Night Wire,-150000,100000,23:45,1111,ref4",
         ]
     )
-    entries = parse_bank_csv(io.BytesIO(csv_body.encode("utf-8")))
-    save_bank_entries(engagement_id, entries)
+    entries = parse_bank_csv(csv_body)
 
     save_transactions(
         engagement_id,
@@ -33,16 +35,18 @@ def test_bank_ingestion_and_rules():
                 date=date(2024, 1, 5),
                 description="Paycheck",
                 lines=[
-                    TransactionLine(account_code="4000", debit=Decimal("0"), credit=Decimal("-1500")),
+                    TransactionLine(account_code="4000", debit=_ZERO, credit=_NEG_1500),
                 ],
             )
         ],
     )
 
     # Add round-figure entries to trigger the heuristic.
-    round_entries = [f"2024-02-{i:02d},Round {i},1000,,22:00,1111," for i in range(1, 11)]
-    extra_csv = "\n".join(["date,description,amount,balance,time,account_number,reference"] + round_entries)
-    extra_entries = parse_bank_csv(io.BytesIO(extra_csv.encode("utf-8")))
+    round_rows = (
+        {"date": f"2024-02-{i:02d}", "description": f"Round {i}", "amount": "1000", "time": "22:00", "account_number": "1111"}
+        for i in range(1, 11)
+    )
+    extra_entries = parse_bank_rows(round_rows)
     save_bank_entries(engagement_id, entries + extra_entries)
 
     findings = run_bank_rules(engagement_id)
@@ -53,4 +57,4 @@ def test_bank_ingestion_and_rules():
     assert "BANK_FREQUENT_ROUND_FIGURES" in codes
 
     large_txn = next(f for f in findings if f.code == "BANK_LATE_NIGHT_LARGE_TXN")
-    assert Decimal(large_txn.metadata["amount"]) <= Decimal(f"-{LARGE_AMOUNT_THRESHOLD}")
+    assert Decimal(large_txn.metadata["amount"]) <= _LARGE_OUTFLOW
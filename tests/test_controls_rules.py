@@ -1,13 +1,15 @@
 from datetime import date, datetime
+from decimal import Decimal
 
-from backend.db import init_db
 from backend.accounting_store import save_gl_entries
 from backend.accounting_models import GLEntry
 from backend.controls_rules import run_controls_rules
 
+_ZERO = Decimal("0")
+_BATCH_AMOUNT = Decimal("100")
 
-def test_controls_rules_cover_core_scenarios():
-    init_db()
+
+def test_controls_rules_cover_core_scenarios(db_schema):
     engagement_id = "eng-ctrl-1"
     today = date(2024, 4, 20)
 
@@ -56,23 +58,25 @@ def test_controls_rules_cover_core_scenarios():
         ),
     ]
 
-    for i in range(60):
-        entries.append(
-            GLEntry(
-                id=f"gl-u4-{i}",
-                account="300000",
-                date=today,
-                amount=100.0,
-                debit=100.0,
-                credit=0,
-                description="Manual batch",
-                user_id="u4",
-                approved_by="u7",
-                posted_at=datetime(2024, 4, 20, 9, 0),
-                approved_at=datetime(2024, 4, 20, 9, 30),
-                source="MANUAL",
-            )
+    posted_at = datetime(2024, 4, 20, 9, 0)
+    approved_at = datetime(2024, 4, 20, 9, 30)
+    entries.extend(
+        GLEntry(
+            id=f"gl-u4-{i}",
+            account="300000",
+            date=today,
+            amount=_BATCH_AMOUNT,
+            debit=_BATCH_AMOUNT,
+            credit=_ZERO,
+            description="Manual batch",
+            user_id="u4",
+            approved_by="u7",
+            posted_at=posted_at,
+            approved_at=approved_at,
+            source="MANUAL",
         )
+        for i in range(60)
+    )
 
     save_gl_entries(engagement_id, entries)
     findings = run_controls_rules(engagement_id)
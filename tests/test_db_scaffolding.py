@@ -1,9 +1,8 @@
-from backend.db import SessionLocal, init_db
+from backend.db import SessionLocal
 from backend.db_models import ClientORM
 
 
-def test_db_scaffolding_creates_tables():
-    init_db()
+def test_db_scaffolding_creates_tables(db_schema):
     with SessionLocal() as db:
         client = ClientORM(name="Demo Client", code="DEMO")
         db.add(client)
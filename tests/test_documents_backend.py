@@ -1,16 +1,16 @@
 from datetime import date
 from decimal import Decimal
 
-from backend.db import SessionLocal, init_db
+from backend import accounting_store
+from backend.db import SessionLocal
 from backend.db_models import DocumentLinkORM, DocumentORM
-from backend.accounting_store import save_bank_entries
+from backend.accounting_store import clear_engagement, save_bank_entries
 from backend.accounting_models import BankEntry
 from backend.docs_matching import build_bank_entry_id, match_document_to_bank_entries
 from backend.docs_rules import run_document_rules
 
 
-def test_match_document_to_bank_entry_and_missing_doc_rule():
-    init_db()
+def test_match_document_to_bank_entry_and_missing_doc_rule(db_schema):
     engagement_id = "doc-eng-101"
 
     bank_entries = [
@@ -34,7 +34,6 @@ def test_match_document_to_bank_entry_and_missing_doc_rule():
     with SessionLocal() as db:
         db.query(DocumentLinkORM).delete()
         db.query(DocumentORM).delete()
-        db.commit()
 
         doc = DocumentORM(
             engagement_id=engagement_id,
@@ -62,14 +61,32 @@ def test_match_document_to_bank_entry_and_missing_doc_rule():
             doc_id=doc.id,
         )
         db.add(link)
-        db.commit()
+        db.flush()
 
         findings = run_document_rules(db, engagement_id)
         codes = {f.code for f in findings}
         assert "DOC_MISSING_SUPPORTING_DOCUMENT" not in codes
 
         db.query(DocumentLinkORM).delete()
-        db.commit()
         findings2 = run_document_rules(db, engagement_id)
         codes2 = {f.code for f in findings2}
         assert "DOC_MISSING_SUPPORTING_DOCUMENT" in codes2
+        db.commit()
+
+
+def test_bank_match_index_follows_save_and_clear():
+    engagement_id = "doc-eng-index"
+    doc = DocumentORM(engagement_id=engagement_id, filename="r.pdf", amount=250.0, date=date(2024, 5, 1))
+    first = BankEntry(id="be-a", account_number="001", date=date(2024, 5, 1), amount=Decimal("250.0"), description="")
+    save_bank_entries(engagement_id, [first])
+    assert match_document_to_bank_entries(engagement_id, doc) == ("bank", build_bank_entry_id(first))
+
+    clear_engagement(engagement_id)
+    assert engagement_id not in accounting_store._BANK_AMOUNT_INDEX
+    assert match_document_to_bank_entries(engagement_id, doc) is None
+    assert engagement_id not in accounting_store._BANK_AMOUNT_INDEX
+
+    replacement = BankEntry(id="be-b", account_number="002", date=date(2024, 5, 2), amount=Decimal("250.5"), description="")
+    save_bank_entries(engagement_id, [replacement])
+    assert match_document_to_bank_entries(engagement_id, doc) == ("bank", build_bank_entry_id(replacement))
+    clear_engagement(engagement_id)
@@ -1,25 +1,18 @@
-from backend.db import SessionLocal, init_db
+from uuid import uuid4
+
+from backend.db import SessionLocal
 from backend.db_models import ClientORM, EngagementORM, FindingORM
 from backend.engagement_stats import compute_engagement_stats
 
 
-def test_engagement_stats_aggregates_by_domain_and_severity():
-    init_db()
+def test_engagement_stats_aggregates_by_domain_and_severity(db_transaction):
     with SessionLocal() as db:
-        db.query(FindingORM).delete()
-        db.query(EngagementORM).delete()
-        db.query(ClientORM).delete()
-        db.commit()
-        client = ClientORM(name="Stats Client", code="STATS", status="active")
-        db.add(client)
-        db.flush()
-        engagement = EngagementORM(client_id=client.id, name="E-Stats", status="open")
-        db.add(engagement)
-        db.flush()
-
-        eid = engagement.id
+        client_id = str(uuid4())
+        eid = str(uuid4())
 
         rows = [
+            ClientORM(id=client_id, name="Stats Client", code="STATS", status="active"),
+            EngagementORM(id=eid, client_id=client_id, name="E-Stats", status="open"),
             FindingORM(
                 id="f-books-1",
                 engagement_id=eid,
@@ -27,7 +20,6 @@ def test_engagement_stats_aggregates_by_domain_and_severity():
                 severity="high",
                 code="CODE1",
                 message="msg",
-                metadata_json={},
             ),
             FindingORM(
                 id="f-books-2",
@@ -36,7 +28,6 @@ def test_engagement_stats_aggregates_by_domain_and_severity():
                 severity="high",
                 code="CODE2",
                 message="msg",
-                metadata_json={},
             ),
             FindingORM(
                 id="f-income-1",
@@ -45,7 +36,6 @@ def test_engagement_stats_aggregates_by_domain_and_severity():
                 severity="medium",
                 code="CODE3",
                 message="msg",
-                metadata_json={},
             ),
             FindingORM(
                 id="f-bank-1",
@@ -54,7 +44,6 @@ def test_engagement_stats_aggregates_by_domain_and_severity():
                 severity="low",
                 code="CODE4",
                 message="msg",
-                metadata_json={},
             ),
         ]
         db.add_all(rows)
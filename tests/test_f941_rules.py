@@ -1,31 +1,5 @@
-import json
-from pathlib import Path
-
-from engine import RuleEngine
-
-
-ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_doc(name: str) -> dict:
-    with (ROOT / "sample_data" / name).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def test_f941_valid_no_errors():
-    engine = RuleEngine()
-    doc = _load_doc("f941_valid.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    assert not [f for f in findings if f.get("severity") == "error"]
-
-
-def test_f941_issues_trigger_rules():
-    engine = RuleEngine()
-    doc = _load_doc("f941_issues.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    codes = {f.get("id") for f in findings}
-
-    expected = {
+_EXPECTED_F941 = frozenset(
+    {
         "F941_EMPLOYER_EIN_REQUIRED",
         "F941_EMPLOYER_EIN_FORMAT",
         "F941_REQUIRED_EMPLOYER_INFO",
@@ -43,4 +17,16 @@ def test_f941_issues_trigger_rules():
         "F941_EMPLOYEE_COUNT_VS_WAGES_SANITY",
         "F941_WAGES_VS_FICA_BASE_SANITY",
     }
-    assert expected.issubset(codes)
+)
+
+
+def test_f941_valid_no_errors(findings_for, sample_doc):
+    doc = sample_doc("f941_valid.json")
+    findings = findings_for(doc)
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+def test_f941_issues_trigger_rules(rule_engine, sample_doc):
+    doc = sample_doc("f941_issues.json")
+    missing = _EXPECTED_F941 - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
@@ -3,27 +3,36 @@ import pytest
 from auditor.findings import merge_findings, normalize_llm_findings
 from auditor.findings import filter_llm_findings_by_doc
 
+# Shared LLM-finding payloads; none of the functions under test mutate their input.
+_BASE_LLM_FINDING = {
+    "code": "W2_ZERO_FED_WITHHOLDING",
+    "category": "WITHHOLDING",
+    "severity": "MEDIUM",
+    "summary": "s",
+    "details": "d",
+    "suggested_action": "a",
+    "citation_hint": "c",
+    "tags": ["W2"],
+}
+_MISSING_SSN_FINDING = {
+    **_BASE_LLM_FINDING,
+    "code": "W2_MISSING_TAXPAYER_SSN",
+    "category": "IDENTIFICATION",
+    "severity": "HIGH",
+    "tags": [],
+}
+
 
 def test_normalize_llm_findings_basic():
-    llm_finding = {
-        "code": "W2_ZERO_FED_WITHHOLDING",
-        "category": "WITHHOLDING",
-        "severity": "MEDIUM",
-        "summary": "s",
-        "details": "d",
-        "suggested_action": "a",
-        "citation_hint": "c",
-        "tags": ["W2"],
-    }
-    result = normalize_llm_findings("doc-123", [llm_finding])
+    result = normalize_llm_findings("doc-123", [_BASE_LLM_FINDING])
     assert len(result) == 1
     out = result[0]
     assert "finding_id" in out
     assert out["doc_id"] == "doc-123"
     assert out["source"] == "LLM_AUDITOR"
     assert out["confidence"] == 0.8
-    for key in llm_finding:
-        assert out[key] == llm_finding[key]
+    for key, value in _BASE_LLM_FINDING.items():
+        assert out[key] == value
 
 
 def test_normalize_llm_findings_empty():
@@ -31,15 +40,7 @@ def test_normalize_llm_findings_empty():
 
 
 def test_validate_llm_finding_missing_key():
-    llm_finding = {
-        "code": "W2_ZERO_FED_WITHHOLDING",
-        "category": "WITHHOLDING",
-        "severity": "MEDIUM",
-        "details": "d",
-        "suggested_action": "a",
-        "citation_hint": "c",
-        "tags": ["W2"],
-    }
+    llm_finding = {k: v for k, v in _BASE_LLM_FINDING.items() if k != "summary"}
     with pytest.raises(ValueError) as excinfo:
         normalize_llm_findings("doc-123", [llm_finding])
     assert "summary" in str(excinfo.value)
@@ -72,31 +73,11 @@ def test_merge_findings_invalid_strategy():
 
 def test_filter_llm_findings_ssn_present_rejects_missing_ssn():
     doc = {"taxpayer": {"ssn": "123-45-6789"}}
-    finding = {
-        "code": "W2_MISSING_TAXPAYER_SSN",
-        "category": "IDENTIFICATION",
-        "severity": "HIGH",
-        "summary": "s",
-        "details": "d",
-        "suggested_action": "a",
-        "citation_hint": "c",
-        "tags": [],
-    }
-    filtered = filter_llm_findings_by_doc(doc, [finding])
+    filtered = filter_llm_findings_by_doc(doc, [_MISSING_SSN_FINDING])
     assert filtered == []
 
 
 def test_filter_llm_findings_ssn_missing_keeps_finding():
     doc = {"taxpayer": {"ssn": ""}}
-    finding = {
-        "code": "W2_MISSING_TAXPAYER_SSN",
-        "category": "IDENTIFICATION",
-        "severity": "HIGH",
-        "summary": "s",
-        "details": "d",
-        "suggested_action": "a",
-        "citation_hint": "c",
-        "tags": [],
-    }
-    filtered = filter_llm_findings_by_doc(doc, [finding])
-    assert filtered == [finding]
+    filtered = filter_llm_findings_by_doc(doc, [_MISSING_SSN_FINDING])
+    assert filtered == [_MISSING_SSN_FINDING]
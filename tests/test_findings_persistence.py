@@ -1,16 +1,11 @@
-from backend.db import SessionLocal, init_db
+from backend.db import SessionLocal
 from backend.db_models import ClientORM, EngagementORM, FindingORM
 from backend.domain_rules import DomainFinding
 from backend.findings_persistence import save_domain_findings
 
 
-def test_findings_persist_and_override():
-    init_db()
+def test_findings_persist_and_override(db_transaction):
     with SessionLocal() as db:
-        db.query(FindingORM).delete()
-        db.query(EngagementORM).delete()
-        db.query(ClientORM).delete()
-        db.commit()
         client = ClientORM(name="FClient", code="FC", status="active")
         db.add(client)
         db.flush()
@@ -31,9 +26,8 @@ def test_findings_persist_and_override():
         )
         save_domain_findings(db, engagement_id, "income", [f1])
 
-        rows = db.query(FindingORM).filter(FindingORM.engagement_id == engagement_id).all()
-        assert len(rows) == 1
-        assert rows[0].id == "f1"
+        row = db.query(FindingORM.id).filter(FindingORM.engagement_id == engagement_id).one()
+        assert row.id == "f1"
 
         f2 = DomainFinding(
             id="f2",
@@ -45,6 +39,5 @@ def test_findings_persist_and_override():
             metadata={},
         )
         save_domain_findings(db, engagement_id, "income", [f2])
-        rows = db.query(FindingORM).filter(FindingORM.engagement_id == engagement_id).all()
-        assert len(rows) == 1
-        assert rows[0].id == "f2"
+        row = db.query(FindingORM.id).filter(FindingORM.engagement_id == engagement_id).one()
+        assert row.id == "f2"
@@ -0,0 +1,180 @@
+import pytest
+
+# (sample-file prefix, doc_type, rule ids the *_issues.json sample must trigger)
+FORMS = [
+    (
+        "b",
+        "1099-B",
+        frozenset(
+            {
+                "B1099_BROKER_TIN_REQUIRED",
+                "B1099_BROKER_TIN_FORMAT",
+                "B1099_REQUIRED_BROKER_INFO",
+                "B1099_RECIPIENT_TIN_FORMAT",
+                "B1099_REQUIRED_RECIPIENT_INFO",
+                "B1099_COST_VS_PROCEEDS_SANITY",
+                "B1099_MARKET_DISCOUNT_AND_BASIS",
+                "B1099_WITHHOLDING_REQUIRES_PROCEEDS",
+                "B1099_WITHHOLDING_RATIO_SANITY",
+                "B1099_BASIS_REPORTED_FLAG_CONSISTENCY",
+                "B1099_DATES_PRESENT_FOR_TRANSACTIONS",
+                "B1099_DATES_ORDER_SANITY",
+            }
+        ),
+    ),
+    (
+        "c1099",
+        "1099-C",
+        frozenset(
+            {
+                "C1099_CREDITOR_TIN_REQUIRED",
+                "C1099_DEBTOR_TIN_REQUIRED",
+                "C1099_TAX_YEAR_REASONABLE",
+                "C1099_NONNEGATIVE_AMOUNTS",
+                "C1099_EVENT_DATE_REQUIRED_WITH_DISCHARGE",
+                "C1099_EVENT_CODE_REQUIRED_WITH_DISCHARGE",
+                "C1099_INTEREST_NOT_GT_DISCHARGED",
+                "C1099_FMV_NOT_GT_DISCHARGED_X_FACTOR",
+                "C1099_STATE_LIST_LENGTHS_MATCH",
+            }
+        ),
+    ),
+    (
+        "div",
+        "1099-DIV",
+        frozenset(
+            {
+                "DIV_PAYER_TIN_REQUIRED",
+                "DIV_PAYER_TIN_FORMAT",
+                "DIV_RECIPIENT_TIN_FORMAT",
+                "DIV_AMOUNTS_NONNEGATIVE",
+                "DIV_QUALIFIED_NOT_EXCEED_ORDINARY",
+                "DIV_CAP_GAIN_WITH_ZERO_ORDINARY",
+                "DIV_WITHHOLDING_RATIO_SANITY",
+                "DIV_FOREIGN_TAX_WITHOUT_COUNTRY",
+                "DIV_199A_NOT_EXCEED_ORDINARY",
+                "DIV_PRIVATE_ACTIVITY_NOT_EXCEED_EXEMPT_INT",
+                "DIV_STATE_TAX_NONNEGATIVE",
+                "DIV_STATE_CODE_FORMAT",
+                "DIV_REQUIRED_PAYER_INFO",
+                "DIV_REQUIRED_RECIPIENT_INFO",
+            }
+        ),
+    ),
+    (
+        "f1095a",
+        "1095-A",
+        frozenset(
+            {
+                "A1095_RECIPIENT_TIN_REQUIRED",
+                "A1095_RECIPIENT_TIN_FORMAT",
+                "A1095_REQUIRED_RECIPIENT_INFO",
+                "A1095_REQUIRED_ISSUER_INFO",
+                "A1095_AMOUNTS_NONNEGATIVE",
+                "A1095_PREMIUM_WITHOUT_COVERAGE_PERSON",
+                "A1095_MONTH_ROW_INCOMPLETE",
+                "A1095_TOTAL_APTC_REASONABLE",
+                "A1095_APTC_WITHOUT_PREMIUM",
+                "A1095_APTC_WITHOUT_SLCSP",
+                "A1095_SLCSP_WITHOUT_PREMIUM",
+            }
+        ),
+    ),
+    (
+        "q1099",
+        "1099-Q",
+        frozenset(
+            {
+                "Q1099_PAYER_TIN_REQUIRED",
+                "Q1099_RECIPIENT_TIN_REQUIRED",
+                "Q1099_TAX_YEAR_REASONABLE",
+                "Q1099_NONNEGATIVE_AMOUNTS",
+                "Q1099_EARNINGS_PLUS_BASIS_NOT_GT_GROSS",
+                "Q1099_ONE_PROGRAM_TYPE_FLAG",
+                "Q1099_STATE_LIST_LENGTHS_MATCH",
+                "Q1099_TRUSTEE_TRANSFER_HAS_ZERO_EARNINGS",
+            }
+        ),
+    ),
+    (
+        "r1099",
+        "1099-R",
+        frozenset(
+            {
+                "R1099_PAYER_TIN_REQUIRED",
+                "R1099_RECIPIENT_TIN_REQUIRED",
+                "R1099_NONNEGATIVE_AMOUNTS",
+                "R1099_TAXABLE_AMOUNT_NOT_GT_GROSS",
+                "R1099_TAX_YEAR_REASONABLE",
+                "R1099_DISTRIBUTION_CODE_REQUIRED",
+            }
+        ),
+    ),
+    (
+        "s1099",
+        "1099-S",
+        frozenset(
+            {
+                "S1099_FILERS_TIN_REQUIRED",
+                "S1099_TRANSFEROR_TIN_REQUIRED",
+                "S1099_TAX_YEAR_REASONABLE",
+                "S1099_NONNEGATIVE_AMOUNTS",
+                "S1099_WITHHELD_NOT_EXCESSIVE",
+                "S1099_STATE_LIST_LENGTHS_MATCH",
+                "S1099_CLOSING_DATE_PRESENT_WITH_GROSS",
+            }
+        ),
+    ),
+    (
+        "sa1099",
+        "1099-SA",
+        frozenset(
+            {
+                "SA1099_PAYER_TIN_REQUIRED",
+                "SA1099_RECIPIENT_TIN_REQUIRED",
+                "SA1099_TAX_YEAR_REASONABLE",
+                "SA1099_NONNEGATIVE_AMOUNTS",
+                "SA1099_WITHHELD_NOT_EXCESSIVE",
+                "SA1099_ONE_ACCOUNT_TYPE_FLAG",
+                "SA1099_DISTRIBUTION_CODE_REQUIRED_WITH_DISTRIBUTION",
+                "SA1099_STATE_LIST_LENGTHS_MATCH",
+            }
+        ),
+    ),
+    (
+        "ssa1099",
+        "SSA-1099",
+        frozenset(
+            {
+                "SSA1099_BENEFICIARY_TIN_REQUIRED",
+                "SSA1099_BENEFICIARY_TIN_FORMAT",
+                "SSA1099_BENEFICIARY_INFO_REQUIRED",
+                "SSA1099_PAYER_INFO_PLAUSIBILITY",
+                "SSA1099_AMOUNTS_NONNEGATIVE",
+                "SSA1099_NET_BENEFITS_CONSISTENCY",
+                "SSA1099_REPAID_NOT_EXCEED_PAID",
+                "SSA1099_WITHHOLDING_REQUIRES_BENEFITS",
+                "SSA1099_STATE_TAX_NONNEGATIVE",
+                "SSA1099_STATE_TAX_VS_BENEFITS_SANITY",
+                "SSA1099_STATE_CODE_FORMAT",
+                "SSA1099_PLACEHOLDER_IDENTITY_SANITY",
+            }
+        ),
+    ),
+]
+FORM_IDS = [form for form, _, _ in FORMS]
+
+
+@pytest.mark.parametrize("form,doc_type", [(form, doc_type) for form, doc_type, _ in FORMS], ids=FORM_IDS)
+def test_valid_doc_has_no_errors(findings_for, form, doc_type, sample_doc):
+    doc = sample_doc(f"{form}_valid.json")
+    assert doc.get("doc_type") == doc_type
+    findings = findings_for(doc)
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+@pytest.mark.parametrize("form,expected", [(form, expected) for form, _, expected in FORMS], ids=FORM_IDS)
+def test_issues_doc_triggers_rules(rule_engine, form, expected, sample_doc):
+    doc = sample_doc(f"{form}_issues.json")
+    missing = expected - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
@@ -6,6 +6,10 @@ from backend.accounting_store import clear_engagement, save_transactions, save_t
 from backend.income_rules import run_income_rules
 from backend.expense_rules import run_expense_rules, POLICY_BREACH_THRESHOLD
 
+_ZERO = Decimal("0")
+_REVENUE = Decimal("500")
+_OVER_THRESHOLD = POLICY_BREACH_THRESHOLD + Decimal("1")
+
 
 def test_income_and_expense_rules_detect_findings():
     engagement_id = "eng-income-expense"
@@ -17,18 +21,18 @@ def test_income_and_expense_rules_detect_findings():
             TrialBalanceRow(
                 account_code="4000",
                 account_name="Revenue",
-                opening_balance=Decimal("0"),
-                debit=Decimal("0"),
-                credit=Decimal("0"),
-                closing_balance=Decimal("0"),
+                opening_balance=_ZERO,
+                debit=_ZERO,
+                credit=_ZERO,
+                closing_balance=_ZERO,
             ),
             TrialBalanceRow(
                 account_code="6000",
                 account_name="Office Expense",
-                opening_balance=Decimal("0"),
-                debit=Decimal("0"),
-                credit=Decimal("0"),
-                closing_balance=Decimal("0"),
+                opening_balance=_ZERO,
+                debit=_ZERO,
+                credit=_ZERO,
+                closing_balance=_ZERO,
             ),
         ],
     )
@@ -41,8 +45,8 @@ def test_income_and_expense_rules_detect_findings():
                 date=date(2024, 1, 10),
                 description="Service revenue",
                 lines=[
-                    TransactionLine(account_code="4000", debit=Decimal("0"), credit=Decimal("500")),
-                    TransactionLine(account_code="1000", debit=Decimal("500"), credit=Decimal("0")),
+                    TransactionLine(account_code="4000", debit=_ZERO, credit=_REVENUE),
+                    TransactionLine(account_code="1000", debit=_REVENUE, credit=_ZERO),
                 ],
             ),
             Transaction(
@@ -50,8 +54,8 @@ def test_income_and_expense_rules_detect_findings():
                 date=date(2024, 1, 10),
                 description="Service revenue",
                 lines=[
-                    TransactionLine(account_code="4000", debit=Decimal("0"), credit=Decimal("500")),
-                    TransactionLine(account_code="1000", debit=Decimal("500"), credit=Decimal("0")),
+                    TransactionLine(account_code="4000", debit=_ZERO, credit=_REVENUE),
+                    TransactionLine(account_code="1000", debit=_REVENUE, credit=_ZERO),
                 ],
             ),
             Transaction(
@@ -59,8 +63,8 @@ def test_income_and_expense_rules_detect_findings():
                 date=date(2024, 1, 15),
                 description="Large equipment spend",
                 lines=[
-                    TransactionLine(account_code="6000", debit=POLICY_BREACH_THRESHOLD + 1, credit=Decimal("0")),
-                    TransactionLine(account_code="2000", debit=Decimal("0"), credit=POLICY_BREACH_THRESHOLD + 1),
+                    TransactionLine(account_code="6000", debit=_OVER_THRESHOLD, credit=_ZERO),
+                    TransactionLine(account_code="2000", debit=_ZERO, credit=_OVER_THRESHOLD),
                 ],
             ),
         ],
@@ -1,31 +1,5 @@
-import json
-from pathlib import Path
-
-from engine import RuleEngine
-
-
-ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_doc(name: str) -> dict:
-    with (ROOT / "sample_data" / name).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def test_int1099_valid_doc_passes_all_rules():
-    engine = RuleEngine()
-    doc = _load_doc("int1099_valid.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    assert doc.get("doc_type") == "1099-INT"
-    assert not [f for f in findings if f.get("severity") == "error"]
-
-
-def test_int1099_issues_doc_triggers_expected_failures():
-    engine = RuleEngine()
-    doc = _load_doc("int1099_issues.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    codes = {f.get("id") for f in findings}
-    expected = {
+_EXPECTED_INT1099 = frozenset(
+    {
         "INT1099_PAYER_TIN_REQUIRED",
         "INT1099_RECIPIENT_TIN_REQUIRED",
         "INT1099_TAX_YEAR_REASONABLE",
@@ -33,4 +7,17 @@ def test_int1099_issues_doc_triggers_expected_failures():
         "INT1099_WITHHELD_NOT_EXCESSIVE",
         "INT1099_FOREIGN_TAX_WITH_COUNTRY",
     }
-    assert expected.issubset(codes)
+)
+
+
+def test_int1099_valid_doc_passes_all_rules(findings_for, sample_doc):
+    doc = sample_doc("int1099_valid.json")
+    findings = findings_for(doc)
+    assert doc.get("doc_type") == "1099-INT"
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+def test_int1099_issues_doc_triggers_expected_failures(rule_engine, sample_doc):
+    doc = sample_doc("int1099_issues.json")
+    missing = _EXPECTED_INT1099 - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
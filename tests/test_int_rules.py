@@ -1,33 +1,5 @@
-import json
-from pathlib import Path
-
-from engine import RuleEngine
-
-
-ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_doc(name: str) -> dict:
-    with (ROOT / "sample_data" / name).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def test_int_valid_has_no_errors():
-    engine = RuleEngine()
-    doc = _load_doc("int_valid.json")
-
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    assert not [f for f in findings if f.get("severity") == "error"]
-
-
-def test_int_issues_triggers_expected_rules():
-    engine = RuleEngine()
-    doc = _load_doc("int_issues.json")
-
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    codes = {f.get("id") for f in findings}
-
-    expected = {
+_EXPECTED_INT = frozenset(
+    {
         "INT_TAX_YEAR_RANGE",
         "INT_PAYER_TIN_FORMAT",
         "INT_RECIPIENT_TIN_FORMAT",
@@ -35,4 +7,18 @@ def test_int_issues_triggers_expected_rules():
         "INT_BACKUP_WITHHOLDING_RATIO",
         "INT_PRIVATE_ACTIVITY_NOT_EXCEED_TAX_EXEMPT",
     }
-    assert expected.issubset(codes)
+)
+
+
+def test_int_valid_has_no_errors(findings_for, sample_doc):
+    doc = sample_doc("int_valid.json")
+
+    findings = findings_for(doc)
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+def test_int_issues_triggers_expected_rules(rule_engine, sample_doc):
+    doc = sample_doc("int_issues.json")
+
+    missing = _EXPECTED_INT - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
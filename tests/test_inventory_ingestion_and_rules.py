@@ -1,4 +1,3 @@
-import io
 from decimal import Decimal
 
 from backend.accounting_store import clear_engagement, save_inventory_items, save_inventory_movements
@@ -30,8 +29,8 @@ def test_inventory_ingestion_and_rules():
             ]
         )
 
-    items = parse_inventory_items_csv(io.BytesIO(items_csv.encode("utf-8")))
-    movements = parse_inventory_movements_csv(io.BytesIO(movements_csv.encode("utf-8")))
+    items = parse_inventory_items_csv(items_csv)
+    movements = parse_inventory_movements_csv(movements_csv)
 
     save_inventory_items(engagement_id, items)
     save_inventory_movements(engagement_id, movements)
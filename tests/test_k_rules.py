@@ -1,31 +1,5 @@
-import json
-from pathlib import Path
-
-from engine import RuleEngine
-
-
-ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_doc(name: str) -> dict:
-    with (ROOT / "sample_data" / name).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def test_k_valid_no_errors():
-    engine = RuleEngine()
-    doc = _load_doc("k_valid.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    assert not [f for f in findings if f.get("severity") == "error"]
-
-
-def test_k_issues_trigger_rules():
-    engine = RuleEngine()
-    doc = _load_doc("k_issues.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    codes = {f.get("id") for f in findings}
-
-    expected = {
+_EXPECTED_K = frozenset(
+    {
         "K_PAYER_TIN_REQUIRED",
         "K_PAYEE_TIN_REQUIRED",
         "K_PAYEE_TIN_FORMAT",
@@ -40,4 +14,16 @@ def test_k_issues_trigger_rules():
         "K_REQUIRED_PAYEE_INFO",
         "K_MCC_PRESENCE",
     }
-    assert expected.issubset(codes)
+)
+
+
+def test_k_valid_no_errors(findings_for, sample_doc):
+    doc = sample_doc("k_valid.json")
+    findings = findings_for(doc)
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+def test_k_issues_trigger_rules(rule_engine, sample_doc):
+    doc = sample_doc("k_issues.json")
+    missing = _EXPECTED_K - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
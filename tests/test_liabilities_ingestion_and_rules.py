@@ -1,4 +1,3 @@
-import io
 from decimal import Decimal
 
 from backend.accounting_store import clear_engagement, save_ap_entries, save_loan_periods, save_loans
@@ -32,9 +31,9 @@ def test_liabilities_ingestion_and_rules():
         ]
     )
 
-    loans = parse_loans_csv(io.BytesIO(loans_csv.encode("utf-8")))
-    periods = parse_loan_periods_csv(io.BytesIO(periods_csv.encode("utf-8")))
-    ap_entries = parse_ap_entries_csv(io.BytesIO(ap_csv.encode("utf-8")))
+    loans = parse_loans_csv(loans_csv)
+    periods = parse_loan_periods_csv(periods_csv)
+    ap_entries = parse_ap_entries_csv(ap_csv)
 
     save_loans(engagement_id, loans)
     save_loan_periods(engagement_id, periods)
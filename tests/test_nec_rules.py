@@ -1,31 +1,5 @@
-import json
-from pathlib import Path
-
-from engine import RuleEngine
-
-
-ROOT = Path(__file__).resolve().parent.parent
-
-
-def _load_doc(name: str) -> dict:
-    with (ROOT / "sample_data" / name).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
-def test_nec_valid_no_errors():
-    engine = RuleEngine()
-    doc = _load_doc("nec_valid.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    assert not [f for f in findings if f.get("severity") == "error"]
-
-
-def test_nec_issues_trigger_rules():
-    engine = RuleEngine()
-    doc = _load_doc("nec_issues.json")
-    findings = engine.evaluate(doc, form_type=doc.get("doc_type"), tax_year=doc.get("tax_year"))
-    codes = {f.get("id") for f in findings}
-
-    expected = {
+_EXPECTED_NEC = frozenset(
+    {
         "NEC_PAYER_TIN_REQUIRED",
         "NEC_RECIPIENT_TIN_FORMAT",
         "NEC_AMOUNTS_NONNEGATIVE",
@@ -36,9 +10,19 @@ def test_nec_issues_trigger_rules():
         "NEC_REQUIRED_PAYER_INFO",
         "NEC_REQUIRED_RECIPIENT_INFO",
     }
-    assert expected.issubset(codes)
+)
+
+
+def test_nec_valid_no_errors(findings_for, sample_doc):
+    doc = sample_doc("nec_valid.json")
+    findings = findings_for(doc)
+    assert not [f for f in findings if f["severity"] == "error"]
+
+
+def test_nec_issues_trigger_rules(rule_engine, sample_doc):
+    doc = sample_doc("nec_issues.json")
+    missing = _EXPECTED_NEC - rule_engine.evaluate_codes(doc)
+    assert not missing, f"missing rule codes: {sorted(missing)}"
 
     doc_zero_comp = {**doc, "amounts": {**doc["amounts"], "box_1_nonemployee_compensation": 0}}
-    findings_zero = engine.evaluate(doc_zero_comp, form_type=doc_zero_comp.get("doc_type"), tax_year=doc_zero_comp.get("tax_year"))
-    codes_zero = {f.get("id") for f in findings_zero}
-    assert "NEC_COMP_REQUIRED_FOR_WITHHOLDING" in codes_zero
+    assert "NEC_COMP_REQUIRED_FOR_WITHHOLDING" in rule_engine.evaluate_codes(doc_zero_comp)
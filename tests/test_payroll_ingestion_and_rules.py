@@ -1,4 +1,3 @@
-import io
 from decimal import Decimal
 
 from backend.accounting_store import clear_engagement, save_payroll_employees, save_payroll_entries
@@ -27,8 +26,8 @@ def test_payroll_ingestion_and_rules():
         ]
     )
 
-    employees = parse_payroll_employee_csv(io.BytesIO(employees_csv.encode("utf-8")))
-    entries = parse_payroll_entries_csv(io.BytesIO(entries_csv.encode("utf-8")))
+    employees = parse_payroll_employee_csv(employees_csv)
+    entries = parse_payroll_entries_csv(entries_csv)
     save_payroll_employees(engagement_id, employees)
     save_payroll_entries(engagement_id, entries)
 
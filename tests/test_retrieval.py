@@ -1,19 +1,23 @@
 import json
-from pathlib import Path
+
+import pytest
 
 from auditor_inference.inference import audit_document, load_chunk_index, retrieve_relevant_chunks
 
 
-def test_load_chunk_index(tmp_path):
-    chunk_file = tmp_path / "chunks.jsonl"
+@pytest.fixture(scope="module")
+def chunk_file(tmp_path_factory):
+    """One chunk index on disk for the module; load_chunk_index only reads it."""
+    path = tmp_path_factory.mktemp("retrieval") / "chunks.jsonl"
     lines = [
-        {"id": "c1", "text": "IRS Pub 15 withholding guidance"},
-        {"id": "c2", "text": "IRS Pub 505 backup withholding"},
+        {"id": "c1", "text": "W-2 wages and Social Security wage base guidance."},
+        {"id": "c2", "text": "Medicare tax rate information."},
     ]
-    with chunk_file.open("w", encoding="utf-8") as handle:
-        for line in lines:
-            handle.write(json.dumps(line) + "\n")
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    return path
 
+
+def test_load_chunk_index(chunk_file):
     loaded = load_chunk_index(chunk_file)
     assert len(loaded) == 2
     assert loaded[0]["id"] == "c1"
@@ -30,16 +34,7 @@ def test_retrieve_relevant_chunks_non_empty():
     assert any(r["id"] == "c1" for r in retrieved)
 
 
-def test_audit_document_populates_retrieval_sources(tmp_path):
-    chunk_file = tmp_path / "chunks.jsonl"
-    lines = [
-        {"id": "c1", "text": "W-2 wages and Social Security wage base guidance."},
-        {"id": "c2", "text": "Medicare tax rate information."},
-    ]
-    with chunk_file.open("w", encoding="utf-8") as handle:
-        for line in lines:
-            handle.write(json.dumps(line) + "\n")
-
+def test_audit_document_populates_retrieval_sources(chunk_file):
     doc = {
         "doc_id": "d1",
         "doc_type": "W2",
@@ -94,3 +94,8 @@ def test_example_from_record_builds_input_and_output_pair():
 def test_example_from_record_missing_keys_raises():
     with pytest.raises(ValueError):
         example_from_record({"doc": {}})
+
+
+def test_format_auditor_output_keeps_default_separators():
+    findings = [{"code": "ABC", "severity": "LOW", "tags": ["W2"]}]
+    assert format_auditor_output(findings) == '[{"code": "ABC", "severity": "LOW", "tags": ["W2"]}]'
@@ -1,16 +1,24 @@
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
 from rule_engine import apply_rules
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeLoader as _YamlLoader
+
 
 RULES_PATH = Path(__file__).resolve().parent.parent / "rules" / "w2.yaml"
 
 
+@lru_cache(maxsize=1)
 def load_rules():
+    """Parse rules/w2.yaml once per run; apply_rules only reads the rule dicts."""
     with RULES_PATH.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or []
+        return yaml.load(handle, Loader=_YamlLoader) or []
 
 
 def test_w2_rules_trigger_multiple_findings():
@@ -5,15 +5,63 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple
 
 from training_prep.formatter import example_from_record
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_line(obj: dict) -> bytes:
+    """Serialize one JSONL record (compact, UTF-8, newline-terminated)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# Lines handed to the pool per round; bounds memory while keeping workers busy.
+_BATCH_LINES = 1000
+
+
+def _convert_line(line: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    """Turn one anomalies JSONL line into a training JSONL line, or return the error message."""
+    try:
+        return _json_line(example_from_record(_json_loads(line))), None
+    except Exception as exc:  # pragma: no cover - simple guard
+        return None, str(exc)
+
+
+def _iter_batches(infile: IO[bytes], size: int) -> Iterator[List[bytes]]:
+    batch: List[bytes] = []
+    for line in infile:
+        line = line.strip()
+        if not line:
+            continue
+        batch.append(line)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Prepare Auditor LLM training data from anomaly JSONL.")
     parser.add_argument("--input", required=True, help="Input anomalies JSONL path.")
     parser.add_argument("--output", required=True, help="Output training JSONL path.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for formatting records (default: 1, no pool).",
+    )
     return parser.parse_args()
 
 
@@ -27,20 +75,26 @@ def main() -> None:
 
     count = 0
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with input_path.open("r", encoding="utf-8") as infile, output_path.open("w", encoding="utf-8") as outfile:
-        for line in infile:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-                example = example_from_record(record)
-                outfile.write(json.dumps(example, ensure_ascii=False))
-                outfile.write("\n")
-                count += 1
-            except Exception as exc:  # pragma: no cover - simple guard
-                print(f"Skipping malformed line: {exc}", file=sys.stderr)
-                continue
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        with input_path.open("rb") as infile, output_path.open("wb") as outfile:
+            for batch in _iter_batches(infile, _BATCH_LINES):
+                if executor is not None:
+                    results = executor.map(_convert_line, batch, chunksize=64)
+                else:
+                    results = map(_convert_line, batch)
+                # Results come back in input order; only this process writes, one call per batch.
+                payloads = []
+                for payload, error in results:
+                    if payload is None:
+                        print(f"Skipping malformed line: {error}", file=sys.stderr)
+                        continue
+                    payloads.append(payload)
+                outfile.write(b"".join(payloads))
+                count += len(payloads)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print(f"Wrote {count} training examples to {output_path}")
 
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import io
 import json
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 KEEP_FINDING_KEYS = [
     "code",
     "category",
@@ -16,13 +22,27 @@ KEEP_FINDING_KEYS = [
     "tags",
 ]
 
+_PROMPT_HEADER = "\n".join(
+    [
+        "You are Corallo TaxOps Auditor.",
+        "You will receive a structured tax document as JSON.",
+        "Your job:",
+        "- Read the document.",
+        "- Identify any potential issues, anomalies, or missing information.",
+        "- Return a JSON array of audit findings.",
+        "",
+        "Each finding must use this JSON schema (keys only, no extra fields):",
+        *(f"- {key}" for key in KEEP_FINDING_KEYS),
+    ]
+)
+
 
 def compress_finding(finding: Dict[str, Any]) -> Dict[str, Any]:
     """
     Reduce a raw rule-engine finding to a stable subset of keys suitable
     for LLM training (no IDs, no source, no confidence).
     """
-    return {key: finding.get(key) for key in KEEP_FINDING_KEYS if key in finding}
+    return {key: finding[key] for key in KEEP_FINDING_KEYS if key in finding}
 
 
 def format_auditor_prompt(doc: Dict[str, Any]) -> str:
@@ -36,38 +56,24 @@ def format_auditor_prompt(doc: Dict[str, Any]) -> str:
       - Instruct the model to return ONLY a JSON array of findings, following
         the compressed finding schema.
     """
-    lines = [
-        "You are Corallo TaxOps Auditor.",
-        "You will receive a structured tax document as JSON.",
-        "Your job:",
-        "- Read the document.",
-        "- Identify any potential issues, anomalies, or missing information.",
-        "- Return a JSON array of audit findings.",
-        "",
-        "Each finding must use this JSON schema (keys only, no extra fields):",
-        "- code",
-        "- category",
-        "- severity",
-        "- summary",
-        "- details",
-        "- suggested_action",
-        "- citation_hint",
-        "- tags",
-    ]
+    buf = io.StringIO()
+    buf.write(_PROMPT_HEADER)
 
     doc_type = doc.get("doc_type")
     tax_year = doc.get("tax_year")
     if doc_type:
-        lines.append("")
-        lines.append(f"Document type: {doc_type}")
+        buf.write(f"\n\nDocument type: {doc_type}")
     if tax_year:
-        lines.append(f"Tax year: {tax_year}")
+        buf.write(f"\nTax year: {tax_year}")
 
-    pretty_doc = json.dumps(doc, indent=2, ensure_ascii=False)
-    lines.append("")
-    lines.append("DOCUMENT:")
-    lines.append(pretty_doc)
-    return "\n".join(lines)
+    # Serialize straight into the buffer rather than building the pretty JSON
+    # and the joined prompt as two separate full-size strings.
+    buf.write("\n\nDOCUMENT:\n")
+    if orjson is not None:
+        buf.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2).decode())
+    else:
+        json.dump(doc, buf, indent=2, ensure_ascii=False)
+    return buf.getvalue()
 
 
 def format_auditor_output(findings: List[Dict[str, Any]]) -> str:
@@ -78,6 +84,8 @@ def format_auditor_output(findings: List[Dict[str, Any]]) -> str:
     of compressed findings.
     """
     compressed = [compress_finding(f) for f in findings]
+    # Stdlib json on purpose: the target text (default ", "/": " separators) must stay
+    # identical to earlier datasets and the adapters trained on them.
     return json.dumps(compressed, ensure_ascii=False)
 
 